@@ -187,8 +187,7 @@ class LightGroupWidget(QtWidgets.QFrame):
         self.light_list.setVisible(not self.light_list.isVisible())
 
     def _on_enable_toggle(self, enabled: bool):
-        self.group.enabled = enabled
-        aurora().session.light_groups[self.group.name] = self.group
+        aurora().set_group_enabled(self.group.name, enabled)
 
 
 class AOVListWidget(QtWidgets.QWidget):
@@ -27,7 +27,7 @@ class LinkMode(Enum):
     EXCLUDE_ALL_INCLUDE_LISTED = "exclude_all"  # Default dark, rules include
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkRelationship:
     """A resolved light-geometry linking relationship"""
     light_path: str
@@ -46,7 +46,7 @@ class LinkRelationship:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkCollection:
     """
     USD-style collection for light linking.
@@ -128,6 +128,7 @@ class LightLinker:
         self._mode = LinkMode.INCLUDE_ALL_EXCLUDE_LISTED
         self._resolved_cache: Dict[str, List[LinkRelationship]] = {}
         self._dirty = True
+        self._revision = 0  # Bumped on every rule/mode change, for checkpointing
 
     @property
     def mode(self) -> LinkMode:
@@ -137,13 +138,20 @@ class LightLinker:
     def mode(self, value: LinkMode) -> None:
         self._mode = value
         self._dirty = True
+        self._revision += 1
+
+    @property
+    def revision(self) -> int:
+        """Monotonic counter of rule/mode changes"""
+        return self._revision
 
     def add_rule(self, rule: LightLinkRule) -> None:
         """Add linking rule"""
         self._rules[rule.rule_id] = rule
         self._dirty = True
+        self._revision += 1
 
-        audit_log().log(
+        audit_log().log_async(
             operation="add_link_rule",
             message=f"Added light link rule: {rule.name}",
             level=AuditLevel.INFO,
@@ -151,13 +159,31 @@ class LightLinker:
             input_data=rule.to_dict(),
         )
 
+    def add_rules(self, rules: List[LightLinkRule]) -> None:
+        """Add several rules with a single invalidation and audit entry"""
+        if not rules:
+            return
+        for rule in rules:
+            self._rules[rule.rule_id] = rule
+        self._dirty = True
+        self._revision += 1
+
+        audit_log().log_async(
+            operation="add_link_rules",
+            message=f"Added {len(rules)} light link rules",
+            level=AuditLevel.INFO,
+            category=AuditCategory.LIGHTING,
+            input_data={"rules": [r.name for r in rules]},
+        )
+
     def remove_rule(self, rule_id: str) -> bool:
         """Remove linking rule"""
         if rule_id in self._rules:
             rule = self._rules.pop(rule_id)
             self._dirty = True
+            self._revision += 1
 
-            audit_log().log(
+            audit_log().log_async(
                 operation="remove_link_rule",
                 message=f"Removed light link rule: {rule.name}",
                 level=AuditLevel.INFO,
@@ -270,10 +296,17 @@ class LightLinker:
         # Get rules sorted by priority
         rules = self.get_rules()
 
+        # Match each pattern once against all paths, recording the rules
+        # that apply to a path as a bitmask (bit i = rules[i])
+        light_masks = self._rule_masks(light_paths, [r.light_pattern for r in rules])
+        geo_masks = self._rule_masks(geometry_paths, [r.geometry_pattern for r in rules])
+
         for light_path in light_paths:
+            light_mask = light_masks.get(light_path, 0)
             for geo_path in geometry_paths:
                 relationship = self._resolve_pair(
-                    light_path, geo_path, rules
+                    light_path, geo_path, rules,
+                    light_mask & geo_masks.get(geo_path, 0),
                 )
                 if relationship:
                     relationships.append(relationship)
@@ -281,13 +314,45 @@ class LightLinker:
         self._dirty = False
         return relationships
 
+    def _rule_masks(self, paths: List[str], patterns: List[str]) -> Dict[str, int]:
+        """Map each path to a bitmask of the pattern indices it matches"""
+        masks: Dict[str, int] = {}
+        for i, pattern in enumerate(patterns):
+            bit = 1 << i
+            for path in self._match_paths(paths, pattern):
+                masks[path] = masks.get(path, 0) | bit
+        return masks
+
+    def _match_paths(self, paths: List[str], pattern: str) -> List[str]:
+        """All paths matching pattern (same rules as _matches_pattern)"""
+        if pattern == "*":
+            return paths
+
+        if "*" in pattern or "?" in pattern:
+            # fnmatch.filter compiles the pattern once for the whole list
+            matched = fnmatch.filter(paths, pattern)
+            if pattern in paths and pattern not in matched:
+                matched.append(pattern)
+            return matched
+
+        if pattern.endswith("/"):
+            return [p for p in paths if p.startswith(pattern)]
+
+        return [pattern] if pattern in paths else []
+
     def _resolve_pair(
         self,
         light_path: str,
         geo_path: str,
         rules: List[LightLinkRule],
+        matched: int,
     ) -> Optional[LinkRelationship]:
-        """Resolve linking for a single light-geometry pair"""
+        """
+        Resolve linking for a single light-geometry pair.
+
+        matched is the bitmask of rules whose light and geometry patterns
+        both match this pair.
+        """
         # Start with defaults based on mode
         if self._mode == LinkMode.INCLUDE_ALL_EXCLUDE_LISTED:
             illumination = True
@@ -298,21 +363,22 @@ class LightLinker:
 
         matched_rule = None
 
-        # Apply rules in priority order
-        for rule in rules:
-            if self._matches_pattern(light_path, rule.light_pattern) and \
-               self._matches_pattern(geo_path, rule.geometry_pattern):
+        # Apply matching rules in priority order
+        while matched:
+            low = matched & -matched
+            matched ^= low
+            rule = rules[low.bit_length() - 1]
 
-                if rule.include:
-                    illumination = rule.illumination
-                    shadow = rule.shadow
-                else:
-                    if rule.illumination:
-                        illumination = False
-                    if rule.shadow:
-                        shadow = False
+            if rule.include:
+                illumination = rule.illumination
+                shadow = rule.shadow
+            else:
+                if rule.illumination:
+                    illumination = False
+                if rule.shadow:
+                    shadow = False
 
-                matched_rule = rule.name
+            matched_rule = rule.name
 
         # Only return if there's a meaningful relationship
         if illumination or shadow:
@@ -506,11 +572,13 @@ class LightLinker:
             self._rules[rule.rule_id] = rule
 
         self._dirty = True
+        self._revision += 1
 
     def clear(self) -> None:
         """Clear all rules"""
         self._rules.clear()
         self._dirty = True
+        self._revision += 1
 
 
 # Module-level instance
@@ -164,8 +164,9 @@ class LPEGenerator:
 
     def get_preset(self, name: str) -> Optional[str]:
         """Get LPE by preset name"""
-        if name in self._custom_presets:
-            return self._custom_presets[name]
+        lpe = self._custom_presets.get(name)
+        if lpe is not None:
+            return lpe
         try:
             return LPEPreset[name.upper()].value
         except KeyError:
@@ -457,6 +458,7 @@ class LPEGenerator:
                 description=f"Auto-generated {role.value} light group",
             )
 
+            lights = []
             for path in paths:
                 light_type_str = light_type_map.get(path, "RectLight")
                 try:
@@ -464,7 +466,9 @@ class LPEGenerator:
                 except ValueError:
                     light_type = LightType.RECT
 
-                group.add_light(path, light_type)
+                lights.append((path, light_type))
+
+            group.add_lights_bulk(lights)
 
             groups.append(group)
 
@@ -5,15 +5,17 @@ Central manager for light groups, AOVs, and linking.
 Handles scene state, persistence, and agent integration.
 """
 
-import json
+import bisect
+from functools import partial
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Callable, Tuple
+from typing import Optional, List, Dict, Any, Callable, Tuple, Iterable, Set
 
 from .models import (
     LightGroup, LightGroupMember, LightType, LightRole,
     AOVDefinition, AOVBundle, AOVType,
-    LightLinkRule,
+    LightLinkRule, intern_str, intern_all,
 )
 from .lpe import LPEGenerator, get_lpe_generator, STANDARD_AOVS
 from .linking import LightLinker, get_light_linker, LinkMode
@@ -21,11 +23,43 @@ from .linking import LightLinker, get_light_linker, LinkMode
 from core.determinism import deterministic_uuid, deterministic_sort
 from core.audit import audit_log, AuditCategory, AuditLevel
 from core.gates import (
-    human_gate, propose_change, GateLevel, GateDecision, GateProposal
+    human_gate, propose_change, snapshot_changes,
+    GateLevel, GateDecision, GateProposal
 )
+from core.jsonio import write_json, read_json, append_jsonl, read_jsonl
 
+def _merge_sorted_paths(current: List[str], incoming: List[str]) -> List[str]:
+    """
+    Update a sorted, deduplicated path cache from a fresh scene scan.
+
+    Small deltas are applied in place with bisect; large ones (over 1/16
+    of the cache) fall back to a full deterministic sort.
+    """
+    if incoming == current:
+        return current
+
+    incoming_set = set(incoming)
+    current_set = set(current)
+    added = incoming_set - current_set
+    removed = current_set - incoming_set
+
+    if not added and not removed:
+        return current
+    if not current or len(added) + len(removed) > len(current) // 16:
+        return deterministic_sort(list(incoming_set))
+
+    result = [p for p in current if p not in removed] if removed else list(current)
+    for path in deterministic_sort(list(added)):
+        bisect.insort(result, path)
+    return result
 
-@dataclass
+
+def delta_path_for(path: Path) -> Path:
+    """Get the incremental checkpoint sidecar for a session file"""
+    return path.with_suffix(".delta.jsonl")
+
+
+@dataclass(slots=True)
 class AuroraSession:
     """
     Aurora session state.
@@ -51,10 +85,69 @@ class AuroraSession:
     created_at: str = ""
     modified_at: str = ""
 
+    # Derived index: prim_path -> number of group memberships (not serialized)
+    _assigned_paths: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    # Cached snapshot of light_groups.values(), reset by add_group/remove_group
+    _groups_view: Optional[Tuple[LightGroup, ...]] = field(default=None, init=False, repr=False)
+
     def __post_init__(self):
         if not self.session_id:
             content = f"{self.sequence_id}:{len(self.light_groups)}"
             self.session_id = deterministic_uuid(content, "aurora_session")
+        self.rebuild_assigned_paths()
+
+    # Assigned-light index
+
+    def rebuild_assigned_paths(self) -> None:
+        """Recompute the assigned-path index from all group members"""
+        self._assigned_paths = {}
+        for group in self.light_groups.values():
+            self.track_paths(m.prim_path for m in group.members)
+
+    def track_paths(self, prim_paths: Iterable[str]) -> None:
+        """Record new group memberships in the assigned-path index"""
+        assigned = self._assigned_paths
+        for path in prim_paths:
+            assigned[path] = assigned.get(path, 0) + 1
+
+    def untrack_paths(self, prim_paths: Iterable[str]) -> None:
+        """Drop group memberships from the assigned-path index"""
+        assigned = self._assigned_paths
+        for path in prim_paths:
+            count = assigned.get(path, 0)
+            if count > 1:
+                assigned[path] = count - 1
+            else:
+                assigned.pop(path, None)
+
+    def is_assigned(self, prim_path: str) -> bool:
+        """Check if a light belongs to any group"""
+        return prim_path in self._assigned_paths
+
+    def groups(self) -> Tuple[LightGroup, ...]:
+        """All light groups in insertion order (shared, read-only snapshot)"""
+        view = self._groups_view
+        if view is None:
+            view = self._groups_view = tuple(self.light_groups.values())
+        return view
+
+    def add_group(self, group: LightGroup) -> None:
+        """Store group, replacing any existing group with the same name"""
+        previous = self.light_groups.get(group.name)
+        if previous is not None:
+            self.untrack_paths(m.prim_path for m in previous.members)
+        self.light_groups[group.name] = group
+        self._groups_view = None
+        self.track_paths(m.prim_path for m in group.members)
+
+    def remove_group(self, name: str) -> Optional[LightGroup]:
+        """Remove group by name, returning it if it existed"""
+        group = self.light_groups.pop(name, None)
+        if group is not None:
+            self._groups_view = None
+            self.untrack_paths(m.prim_path for m in group.members)
+        return group
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -75,16 +168,19 @@ class AuroraSession:
         session = cls(
             session_id=data.get("session_id", ""),
             sequence_id=data.get("sequence_id", ""),
-            active_bundle=data.get("active_bundle", "comp_basic"),
-            bundle_overrides=data.get("bundle_overrides", {}),
-            scene_lights=data.get("scene_lights", []),
-            scene_geometry=data.get("scene_geometry", []),
+            active_bundle=intern_str(data.get("active_bundle", "comp_basic")),
+            bundle_overrides={
+                intern_str(k): v for k, v in data.get("bundle_overrides", {}).items()
+            },
+            scene_lights=intern_all(data.get("scene_lights", [])),
+            scene_geometry=intern_all(data.get("scene_geometry", [])),
             created_at=data.get("created_at", ""),
             modified_at=data.get("modified_at", ""),
         )
 
         for name, group_data in data.get("light_groups", {}).items():
-            session.light_groups[name] = LightGroup.from_dict(group_data)
+            session.light_groups[intern_str(name)] = LightGroup.from_dict(group_data)
+        session.rebuild_assigned_paths()
 
         for aov_data in data.get("custom_aovs", []):
             session.custom_aovs.append(AOVDefinition.from_dict(aov_data))
@@ -116,6 +212,12 @@ class AuroraManager:
 
     _instance: Optional['AuroraManager'] = None
 
+    # Incremental saves fold back into the base snapshot after this many deltas
+    DELTA_COMPACT_THRESHOLD = 64
+
+    # Upper bound on pooled LightGroupMember instances kept for reuse
+    MEMBER_POOL_MAX = 1024
+
     def __init__(self):
         self._session = AuroraSession()
         self._lpe_gen = get_lpe_generator()
@@ -123,32 +225,118 @@ class AuroraManager:
 
         # Pre-built bundles
         self._bundles: Dict[str, AOVBundle] = {}
+        self._bundle_names: Optional[Tuple[str, ...]] = None
+        self._bundles_stale: Set[str] = set()  # Group-derived bundles awaiting rebuild
+        self._bundles_with_groups: Set[str] = set()  # Bundles built from a non-empty group list
         self._init_default_bundles()
 
         # Agent ID for audit trail
         self._agent_id = "aurora"
 
+        # Pre-bound audit loggers, one per category
+        log = audit_log().log_async
+        self._log_lighting = partial(log, category=AuditCategory.LIGHTING, tool="aurora")
+        self._log_aov = partial(log, category=AuditCategory.AOV, tool="aurora")
+        self._log_pipeline = partial(log, category=AuditCategory.PIPELINE, tool="aurora")
+
         # Callbacks for UI updates
         self._on_change: List[Callable[[], None]] = []
+        self._batch_depth = 0
+        self._batch_pending = False
+
+        # Composed AOV cache, invalidated whenever session state changes
+        self._state_version = 0
+        self._aov_cache: Optional[List[AOVDefinition]] = None
+        self._aov_dedupe_cache: Optional[List[AOVDefinition]] = None
+        # Group name -> (AOV flags, generated AOVs); one entry per live group
+        self._group_aov_cache: Dict[str, Tuple[Tuple[bool, ...], List[AOVDefinition]]] = {}
+
+        # Free-list of members removed from groups, reused by add_light_to_group
+        self._member_pool: List[LightGroupMember] = []
+
+        # Dirty tracking for incremental checkpoints
+        self._dirty_groups: Set[str] = set()
+        self._dirty_flags: Set[str] = set()  # meta, scene, custom_aovs, bundle_overrides
+        self._saved_linker_revision = self._linker.revision
+        self._needs_full_save = True
+        self._delta_count = 0
+        self._base_path: Optional[Path] = None  # File the last base snapshot was saved to/loaded from
 
     @classmethod
     def get_instance(cls) -> 'AuroraManager':
         """Get singleton instance"""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        global _AURORA_SINGLETON
+        instance = _AURORA_SINGLETON
+        if instance is None:
+            instance = cls()
+            _AURORA_SINGLETON = instance
+            cls._instance = instance  # Legacy access
+        return instance
 
     @classmethod
     def reset_instance(cls) -> None:
         """Reset singleton (for testing)"""
+        global _AURORA_SINGLETON
+        _AURORA_SINGLETON = None
         cls._instance = None
 
     def on_change(self, callback: Callable[[], None]) -> None:
         """Register change callback for UI updates"""
         self._on_change.append(callback)
 
+    def _invalidate(self) -> None:
+        """Mark derived state (AOV cache) stale after a mutation"""
+        self._state_version += 1
+        self._aov_cache = None
+        self._aov_dedupe_cache = None
+
+    def _mark_dirty(self, group: Optional[str] = None, flag: Optional[str] = None) -> None:
+        """Record what changed since the last checkpoint"""
+        if group is not None:
+            self._dirty_groups.add(group)
+        if flag is not None:
+            self._dirty_flags.add(flag)
+
+    def _reset_dirty(self) -> None:
+        """Mark current state as fully checkpointed"""
+        self._dirty_groups.clear()
+        self._dirty_flags.clear()
+        self._saved_linker_revision = self._linker.revision
+        self._needs_full_save = False
+
+    @property
+    def state_version(self) -> int:
+        """Monotonic counter bumped on every session mutation"""
+        return self._state_version
+
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce change notifications.
+
+        Mutations inside the block fire a single notification on exit.
+        Blocks may be nested; only the outermost one notifies.
+
+        Usage:
+            with manager.batch():
+                manager.create_light_group(...)
+                manager.add_light_to_group(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_pending:
+                self._batch_pending = False
+                self._notify_change()
+
     def _notify_change(self) -> None:
         """Notify listeners of state change"""
+        if self._batch_depth > 0:
+            self._batch_pending = True
+            return
+
         for callback in self._on_change:
             try:
                 callback()
@@ -161,20 +349,23 @@ class AuroraManager:
         self._bundles["comp_full"] = self._lpe_gen.create_comp_full_bundle()
         self._bundles["lookdev"] = self._lpe_gen.create_lookdev_bundle()
         self._bundles["debug"] = self._lpe_gen.create_debug_bundle()
+        self._bundles_stale.clear()
+        self._bundles_with_groups.clear()
+        self._bundle_names = None
 
     # Session Management
 
     def set_sequence(self, sequence_id: str) -> None:
         """Set current sequence/shot"""
+        sequence_id = intern_str(sequence_id)
         self._session.sequence_id = sequence_id
+        self._mark_dirty(flag="meta")
 
-        audit_log().log(
+        self._log_lighting(
             operation="set_sequence",
             message=f"Aurora session set to sequence: {sequence_id}",
             level=AuditLevel.INFO,
-            category=AuditCategory.LIGHTING,
             sequence_id=sequence_id,
-            tool="aurora",
         )
 
     @property
@@ -223,8 +414,7 @@ class AuroraManager:
         )
 
         if lights:
-            for prim_path, light_type in lights:
-                group.add_light(prim_path, light_type)
+            group.add_lights_bulk(lights)
 
         # Propose via gate
         proposal = propose_change(
@@ -233,14 +423,16 @@ class AuroraManager:
             sequence_id=self._session.sequence_id,
             category=AuditCategory.LIGHTING,
             level=gate_level,
-            proposed_changes=group.to_dict(),
+            proposed_changes_blob=snapshot_changes(group),
             reasoning=agent_reasoning,
             confidence=confidence,
             agent_id=self._agent_id,
         )
 
         # Store pending (will be activated on approval)
-        self._session.light_groups[name] = group
+        self._session.add_group(group)
+        self._mark_dirty(group=name)
+        self._invalidate()
 
         self._notify_change()
         return group, proposal
@@ -257,7 +449,11 @@ class AuroraManager:
         if not group:
             return None
 
-        member = group.add_light(prim_path, light_type)
+        pool = self._member_pool
+        member = group.add_light(prim_path, light_type, pool.pop() if pool else None)
+        self._session.track_paths((prim_path,))
+        self._mark_dirty(group=group_name)
+        self._invalidate()
 
         proposal = propose_change(
             operation="add_light_to_group",
@@ -285,40 +481,62 @@ class AuroraManager:
         if not group:
             return False
 
-        result = group.remove_light(prim_path)
+        member = group.pop_light(prim_path)
+        result = member is not None
 
         if result:
-            audit_log().log(
+            self._release_member(member)
+            self._session.untrack_paths((prim_path,))
+            self._mark_dirty(group=group_name)
+            self._invalidate()
+            self._log_lighting(
                 operation="remove_light_from_group",
                 message=f"Removed {prim_path} from '{group_name}'",
                 level=AuditLevel.INFO,
-                category=AuditCategory.LIGHTING,
-                tool="aurora",
             )
             self._notify_change()
 
         return result
 
+    def _release_member(self, member: LightGroupMember) -> None:
+        """Return a removed member to the free-list for reuse"""
+        if len(self._member_pool) < self.MEMBER_POOL_MAX:
+            member.reset("", member.light_type)
+            self._member_pool.append(member)
+
     def delete_light_group(self, name: str) -> bool:
         """Delete light group"""
-        if name in self._session.light_groups:
-            del self._session.light_groups[name]
+        if self._session.remove_group(name) is None:
+            return False
 
-            audit_log().log(
-                operation="delete_light_group",
-                message=f"Deleted light group: {name}",
-                level=AuditLevel.INFO,
-                category=AuditCategory.LIGHTING,
-                tool="aurora",
-            )
+        self._group_aov_cache.pop(name, None)
+        self._mark_dirty(group=name)
+        self._invalidate()
 
-            self._notify_change()
-            return True
-        return False
+        self._log_lighting(
+            operation="delete_light_group",
+            message=f"Deleted light group: {name}",
+            level=AuditLevel.INFO,
+        )
+
+        self._notify_change()
+        return True
 
-    def get_light_groups(self) -> List[LightGroup]:
+    def set_group_enabled(self, name: str, enabled: bool) -> bool:
+        """Enable or disable a light group's AOV generation"""
+        group = self._session.light_groups.get(name)
+        if not group:
+            return False
+
+        group.enabled = enabled
+        self._mark_dirty(group=name)
+        self._invalidate()
+        self._notify_change()
+        return True
+
+    def get_light_groups(self) -> Tuple[LightGroup, ...]:
         """Get all light groups"""
-        return list(self._session.light_groups.values())
+        return self._session.groups()
 
     def get_light_group(self, name: str) -> Optional[LightGroup]:
         """Get specific light group"""
@@ -337,31 +555,35 @@ class AuroraManager:
 
         Returns (groups, proposal) for human review.
         """
-        suggestions = self._lpe_gen.suggest_groups_from_lights(light_paths)
-        groups = self._lpe_gen.create_groups_from_suggestions(
-            suggestions, light_type_map
-        )
+        with self.batch():
+            suggestions = self._lpe_gen.suggest_groups_from_lights(light_paths)
+            groups = self._lpe_gen.create_groups_from_suggestions(
+                suggestions, light_type_map
+            )
 
-        for group in groups:
-            group.created_by = self._agent_id
-            self._session.light_groups[group.name] = group
+            for group in groups:
+                group.created_by = self._agent_id
+                self._session.add_group(group)
+                self._mark_dirty(group=group.name)
+            self._invalidate()
 
-        proposal = propose_change(
-            operation="auto_group_lights",
-            description=f"Auto-created {len(groups)} light groups from {len(light_paths)} lights",
-            sequence_id=self._session.sequence_id,
-            category=AuditCategory.LIGHTING,
-            level=gate_level,
-            proposed_changes={
-                "groups": [g.to_dict() for g in groups],
-                "source_lights": light_paths,
-            },
-            reasoning="Analyzed light names to infer semantic roles (key, fill, rim, etc.)",
-            confidence=0.7,
-            agent_id=self._agent_id,
-        )
+            proposal = propose_change(
+                operation="auto_group_lights",
+                description=f"Auto-created {len(groups)} light groups from {len(light_paths)} lights",
+                sequence_id=self._session.sequence_id,
+                category=AuditCategory.LIGHTING,
+                level=gate_level,
+                proposed_changes_blob=snapshot_changes({
+                    "groups": groups,
+                    "source_lights": light_paths,
+                }),
+                reasoning="Analyzed light names to infer semantic roles (key, fill, rim, etc.)",
+                confidence=0.7,
+                agent_id=self._agent_id,
+            )
+
+            self._notify_change()
 
-        self._notify_change()
         return groups, proposal
 
     # AOV Management
@@ -372,24 +594,29 @@ class AuroraManager:
             return False
 
         self._session.active_bundle = bundle_name
+        self._mark_dirty(flag="meta")
+        self._invalidate()
 
-        audit_log().log(
+        self._log_aov(
             operation="set_aov_bundle",
             message=f"Set active AOV bundle: {bundle_name}",
             level=AuditLevel.INFO,
-            category=AuditCategory.AOV,
-            tool="aurora",
         )
 
         self._notify_change()
         return True
 
-    def get_available_bundles(self) -> List[str]:
+    def get_available_bundles(self) -> Tuple[str, ...]:
         """Get available bundle names"""
-        return list(self._bundles.keys())
+        names = self._bundle_names
+        if names is None:
+            names = self._bundle_names = tuple(self._bundles)
+        return names
 
     def get_bundle(self, name: str) -> Optional[AOVBundle]:
         """Get bundle by name"""
+        if name in self._bundles_stale:
+            self._rebuild_bundle(name)
         return self._bundles.get(name)
 
     def add_custom_aov(
@@ -407,20 +634,20 @@ class AuroraManager:
             aov_type=aov_type,
         )
         self._session.custom_aovs.append(aov)
+        self._mark_dirty(flag="custom_aovs")
+        self._invalidate()
 
-        audit_log().log(
+        self._log_aov(
             operation="add_custom_aov",
             message=f"Added custom AOV: {name}",
             level=AuditLevel.INFO,
-            category=AuditCategory.AOV,
-            tool="aurora",
             input_data=aov.to_dict(),
         )
 
         self._notify_change()
         return aov
 
-    def get_all_aovs(self) -> List[AOVDefinition]:
+    def get_all_aovs(self, dedupe: bool = True) -> List[AOVDefinition]:
         """
         Get all AOVs for current configuration.
 
@@ -428,11 +655,31 @@ class AuroraManager:
         - Active bundle AOVs
         - Per-light-group AOVs
         - Custom AOVs
+
+        With dedupe, each AOV name appears once: it keeps the position of
+        its first occurrence and the definition of its last (so custom
+        AOVs override bundle AOVs of the same name).
+
+        The composed list is cached until the next session mutation.
         """
+        if dedupe:
+            if self._aov_dedupe_cache is None:
+                by_name: Dict[str, AOVDefinition] = {}
+                for aov in self._compose_aovs():
+                    by_name[aov.name] = aov
+                self._aov_dedupe_cache = list(by_name.values())
+            return list(self._aov_dedupe_cache)
+        return list(self._compose_aovs())
+
+    def _compose_aovs(self) -> List[AOVDefinition]:
+        """Build (or reuse) the composed AOV list, duplicates included"""
+        if self._aov_cache is not None:
+            return self._aov_cache
+
         aovs: List[AOVDefinition] = []
 
         # Bundle AOVs
-        bundle = self._bundles.get(self._session.active_bundle)
+        bundle = self.get_bundle(self._session.active_bundle)
         if bundle:
             for aov in bundle.aovs:
                 # Check overrides
@@ -442,17 +689,35 @@ class AuroraManager:
         # Light group AOVs
         for group in self._session.light_groups.values():
             if group.enabled:
-                group_aovs = self._lpe_gen.generate_group_aovs(group)
-                aovs.extend(group_aovs)
+                aovs.extend(self._get_group_aovs(group))
 
         # Custom AOVs
         aovs.extend(self._session.custom_aovs)
 
+        self._aov_cache = aovs
         return aovs
 
+    def _get_group_aovs(self, group: LightGroup) -> List[AOVDefinition]:
+        """Get per-group AOVs, memoized on the settings that shape them"""
+        flags = (
+            group.generate_beauty,
+            group.generate_diffuse,
+            group.generate_specular,
+            group.generate_transmission,
+        )
+        cached = self._group_aov_cache.get(group.name)
+        if cached is not None and cached[0] == flags:
+            return cached[1]
+        # Replaces any entry made under older flags
+        group_aovs = self._lpe_gen.generate_group_aovs(group)
+        self._group_aov_cache[group.name] = (flags, group_aovs)
+        return group_aovs
+
     def toggle_aov(self, aov_name: str, enabled: bool) -> None:
         """Toggle AOV enabled state"""
         self._session.bundle_overrides[aov_name] = enabled
+        self._mark_dirty(flag="bundle_overrides")
+        self._invalidate()
         self._notify_change()
 
     # Light Linking
@@ -466,12 +731,10 @@ class AuroraManager:
         """Set light linking mode"""
         self._linker.mode = mode
 
-        audit_log().log(
+        self._log_lighting(
             operation="set_link_mode",
             message=f"Set light linking mode: {mode.value}",
             level=AuditLevel.INFO,
-            category=AuditCategory.LIGHTING,
-            tool="aurora",
         )
 
     # Scene Integration
@@ -481,17 +744,21 @@ class AuroraManager:
         lights: List[str],
         geometry: List[str],
     ) -> None:
-        """Update cached scene paths"""
-        self._session.scene_lights = deterministic_sort(lights)
-        self._session.scene_geometry = deterministic_sort(geometry)
+        """Update cached scene paths (sorted, deduplicated)"""
+        session = self._session
+        scene_lights = _merge_sorted_paths(session.scene_lights, intern_all(lights))
+        scene_geometry = _merge_sorted_paths(session.scene_geometry, intern_all(geometry))
+
+        if scene_lights is session.scene_lights and scene_geometry is session.scene_geometry:
+            return
+
+        session.scene_lights = scene_lights
+        session.scene_geometry = scene_geometry
+        self._mark_dirty(flag="scene")
 
     def get_unassigned_lights(self) -> List[str]:
         """Get lights not in any group"""
-        assigned = set()
-        for group in self._session.light_groups.values():
-            for member in group.members:
-                assigned.add(member.prim_path)
-
+        assigned = self._session._assigned_paths
         return [p for p in self._session.scene_lights if p not in assigned]
 
     # Persistence
@@ -504,15 +771,20 @@ class AuroraManager:
             "linker": self._linker.to_dict(),
         }
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        write_json(path, data)
+
+        # The base snapshot now covers everything, so drop stale deltas
+        delta_path = delta_path_for(path)
+        if delta_path.exists():
+            delta_path.unlink()
+        self._reset_dirty()
+        self._delta_count = 0
+        self._base_path = Path(path)
 
-        audit_log().log(
+        self._log_pipeline(
             operation="save_aurora_session",
             message=f"Saved Aurora session to {path}",
             level=AuditLevel.INFO,
-            category=AuditCategory.PIPELINE,
-            tool="aurora",
         )
 
     def load_session(self, path: Path) -> bool:
@@ -520,41 +792,178 @@ class AuroraManager:
         if not path.exists():
             return False
 
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(path)
 
         self._session = AuroraSession.from_dict(data.get("session", {}))
         self._linker.from_dict(data.get("linker", {}))
+        self._group_aov_cache.clear()
 
-        # Regenerate bundles with loaded groups
-        self._regenerate_bundles()
+        # Replay incremental checkpoints written since the base snapshot
+        delta_path = delta_path_for(path)
+        records = read_jsonl(delta_path) if delta_path.exists() else []
+        for record in records:
+            self._apply_delta(record)
+        self._reset_dirty()
+        self._delta_count = len(records)
+        self._base_path = Path(path)
 
-        audit_log().log(
+        # Bundles depend on loaded groups; rebuild lazily on first use
+        self._mark_bundles_stale()
+
+        self._log_pipeline(
             operation="load_aurora_session",
             message=f"Loaded Aurora session from {path}",
             level=AuditLevel.INFO,
-            category=AuditCategory.PIPELINE,
-            tool="aurora",
         )
 
         self._notify_change()
         return True
 
+    def save_session_incremental(self, path: Path) -> int:
+        """
+        Checkpoint only what changed since the last save.
+
+        Appends upsert/delete records for dirty groups and changed session
+        fields to a '.delta.jsonl' sidecar next to the base snapshot.
+        Falls back to a full save when no base exists or path is not the
+        file the base was saved to/loaded from, and folds deltas back into
+        the base every DELTA_COMPACT_THRESHOLD records.
+
+        Returns:
+            Number of delta records written (0 if a full save was done)
+        """
+        if self._needs_full_save or Path(path) != self._base_path or not path.exists():
+            self.save_session(path)
+            return 0
+
+        records = self._collect_deltas()
+        if not records:
+            return 0
+
+        append_jsonl(delta_path_for(path), records)
+        self._reset_dirty()
+        self._delta_count += len(records)
+
+        self._log_pipeline(
+            operation="save_aurora_session_delta",
+            message=f"Checkpointed {len(records)} Aurora changes to {path}",
+            level=AuditLevel.DEBUG,
+        )
+
+        if self._delta_count >= self.DELTA_COMPACT_THRESHOLD:
+            self.compact(path)
+
+        return len(records)
+
+    def compact(self, path: Path) -> None:
+        """Fold incremental checkpoints into a fresh base snapshot"""
+        self.save_session(path)
+
+    def _collect_deltas(self) -> List[Dict[str, Any]]:
+        """Build delta records for everything changed since the last save"""
+        records: List[Dict[str, Any]] = []
+        session = self._session
+
+        for name in deterministic_sort(list(self._dirty_groups)):
+            group = session.light_groups.get(name)
+            if group is not None:
+                records.append({"op": "upsert_group", "name": name, "data": group.to_dict()})
+            else:
+                records.append({"op": "delete_group", "name": name})
+
+        flags = self._dirty_flags
+        if "meta" in flags:
+            records.append({"op": "set", "field": "sequence_id", "data": session.sequence_id})
+            records.append({"op": "set", "field": "active_bundle", "data": session.active_bundle})
+        if "scene" in flags:
+            records.append({"op": "set", "field": "scene_lights", "data": session.scene_lights})
+            records.append({"op": "set", "field": "scene_geometry", "data": session.scene_geometry})
+        if "custom_aovs" in flags:
+            records.append({
+                "op": "set",
+                "field": "custom_aovs",
+                "data": [a.to_dict() for a in session.custom_aovs],
+            })
+        if "bundle_overrides" in flags:
+            records.append({"op": "set", "field": "bundle_overrides", "data": session.bundle_overrides})
+        if self._linker.revision != self._saved_linker_revision:
+            records.append({"op": "set", "field": "linker", "data": self._linker.to_dict()})
+
+        return records
+
+    def _apply_delta(self, record: Dict[str, Any]) -> None:
+        """Replay a single incremental checkpoint record"""
+        op = record.get("op")
+        session = self._session
+
+        if op == "upsert_group":
+            session.add_group(LightGroup.from_dict(record["data"]))
+        elif op == "delete_group":
+            session.remove_group(record["name"])
+        elif op == "set":
+            field_name = record["field"]
+            value = record["data"]
+            if field_name == "linker":
+                self._linker.from_dict(value)
+            elif field_name == "custom_aovs":
+                session.custom_aovs = [AOVDefinition.from_dict(a) for a in value]
+            elif field_name in ("scene_lights", "scene_geometry"):
+                setattr(session, field_name, intern_all(value))
+            elif field_name == "bundle_overrides":
+                session.bundle_overrides = {intern_str(k): v for k, v in value.items()}
+            elif field_name in ("sequence_id", "active_bundle"):
+                setattr(session, field_name, intern_str(value))
+
     def _regenerate_bundles(self) -> None:
         """Regenerate bundles with current light groups"""
         groups = list(self._session.light_groups.values())
         self._bundles["comp_basic"] = self._lpe_gen.create_comp_basic_bundle(groups)
         self._bundles["comp_full"] = self._lpe_gen.create_comp_full_bundle(groups)
+        self._bundles_stale.difference_update(("comp_basic", "comp_full"))
+        if groups:
+            self._bundles_with_groups.update(("comp_basic", "comp_full"))
+        else:
+            self._bundles_with_groups.clear()
+        self._invalidate()
+
+    def _mark_bundles_stale(self) -> None:
+        """Defer regeneration of group-derived bundles until accessed"""
+        if self._session.light_groups:
+            self._bundles_stale.update(("comp_basic", "comp_full"))
+        else:
+            # Bundles built without groups are already the defaults
+            self._bundles_stale.update(self._bundles_with_groups)
+        self._invalidate()
+
+    def _rebuild_bundle(self, name: str) -> None:
+        """Rebuild a single stale group-derived bundle"""
+        self._bundles_stale.discard(name)
+        groups = list(self._session.light_groups.values())
+        if groups:
+            self._bundles_with_groups.add(name)
+        else:
+            self._bundles_with_groups.discard(name)
+        if name == "comp_basic":
+            self._bundles[name] = self._lpe_gen.create_comp_basic_bundle(groups)
+        elif name == "comp_full":
+            self._bundles[name] = self._lpe_gen.create_comp_full_bundle(groups)
 
     def clear(self) -> None:
         """Clear session state"""
         self._session = AuroraSession()
         self._linker.clear()
         self._init_default_bundles()
+        self._group_aov_cache.clear()
+        self._needs_full_save = True
+        self._invalidate()
         self._notify_change()
 
 
+# Module-level singleton (avoids a class attribute lookup per aurora() call)
+_AURORA_SINGLETON: Optional[AuroraManager] = None
+
+
 # Convenience function
 def aurora() -> AuroraManager:
     """Get Aurora manager instance"""
-    return AuroraManager.get_instance()
+    return _AURORA_SINGLETON or AuroraManager.get_instance()
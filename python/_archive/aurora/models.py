@@ -5,13 +5,23 @@ Core data structures for light groups, AOV definitions, and LPE generation.
 Designed for comp-ready AOV delivery with deterministic operations.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Set
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Any, Set, Sequence, Tuple, Iterable, Mapping
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 import json
+import sys
 
 from core.determinism import deterministic_uuid, round_float, round_vector
 
+# orjson is optional; to_json() falls back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class LightType(Enum):
     """USD/Karma light types"""
@@ -77,7 +87,100 @@ class LPEComponent(Enum):
     ZERO_OR_MORE = "*"
 
 
-@dataclass
+# Enum <-> value tables used by the serializers (plain dict lookups instead
+# of the Enum .value descriptor and Enum(value) constructor)
+_LIGHT_TYPE_VALUE: Dict[LightType, str] = {m: m.value for m in LightType}
+_LIGHT_ROLE_VALUE: Dict[LightRole, str] = {m: m.value for m in LightRole}
+_AOV_TYPE_VALUE: Dict[AOVType, str] = {m: m.value for m in AOVType}
+_LIGHT_TYPE_BY_VALUE: Dict[str, LightType] = {v: m for m, v in _LIGHT_TYPE_VALUE.items()}
+_LIGHT_ROLE_BY_VALUE: Dict[str, LightRole] = {v: m for m, v in _LIGHT_ROLE_VALUE.items()}
+_AOV_TYPE_BY_VALUE: Dict[str, AOVType] = {v: m for m, v in _AOV_TYPE_VALUE.items()}
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Encode a serialized model as compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+@lru_cache(maxsize=1024)
+def _karma_driver_settings(
+    name: str,
+    aov_type: AOVType,
+    lpe: str,
+    source: str,
+    filter_type: str,
+) -> Mapping[str, Any]:
+    """Build (and memoize) Karma render var settings for an AOV"""
+    settings = {
+        "name": name,
+        "type": _AOV_TYPE_VALUE[aov_type],
+    }
+
+    if lpe:
+        settings["lpe"] = lpe
+    elif source:
+        settings["source"] = source
+
+    if filter_type != "box":
+        settings["filter"] = filter_type
+
+    return MappingProxyType(settings)
+
+
+def _enum_from_value(table: Dict[str, Any], enum_cls: type, value: Any) -> Any:
+    """Look up an enum member by value, deferring to the Enum for errors"""
+    member = table.get(value)
+    return member if member is not None else enum_cls(value)
+
+
+def intern_str(value: Any) -> Any:
+    """Intern str values (prim paths, names, tags); pass anything else through"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_all(values: Iterable[Any]) -> List[Any]:
+    """Intern every str in values"""
+    return [intern_str(v) for v in values]
+
+
+# Constructor field names per model class, for _reduce_init_fields
+_INIT_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _reduce_init_fields(self) -> Tuple[type, Tuple[Any, ...]]:
+    """
+    Pickle as a constructor call over the init fields.
+
+    Keeps snapshots compact (no cached dicts or indexes) and rebuilds
+    derived state on load.
+    """
+    cls = type(self)
+    names = _INIT_FIELDS.get(cls)
+    if names is None:
+        names = _INIT_FIELDS[cls] = tuple(f.name for f in fields(cls) if f.init)
+    return cls, tuple([getattr(self, name) for name in names])
+
+
+# Snapshots of the fields each model's serialized form is built from
+_MEMBER_KEY = attrgetter("prim_path", "light_type", "enabled", "solo", "contribution")
+_GROUP_KEY = attrgetter(
+    "name", "role", "color_tag", "description", "enabled", "intensity_mult",
+    "generate_beauty", "generate_diffuse", "generate_specular",
+    "generate_shadow", "generate_transmission", "group_id", "created_by",
+)
+_AOV_KEY = attrgetter(
+    "name", "aov_type", "lpe", "source", "comp_layer_name", "comp_merge_mode",
+    "light_group", "enabled", "denoise", "filter_type", "aov_id", "description",
+)
+_RULE_KEY = attrgetter(
+    "name", "light_pattern", "geometry_pattern", "illumination", "shadow",
+    "include", "priority", "rule_id", "description",
+)
+
+
+@dataclass(slots=True, eq=False, match_args=False)
 class LightGroupMember:
     """A light belonging to a group"""
     prim_path: str
@@ -86,30 +189,63 @@ class LightGroupMember:
     solo: bool = False
     contribution: float = 1.0  # Multiplier for group contribution
 
+    # Serialized form, reused while the field snapshot it was built from still matches
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_key: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    __reduce__ = _reduce_init_fields
+
     def __post_init__(self):
         self.contribution = round_float(self.contribution, 4)
 
+    def _serialized(self) -> Dict[str, Any]:
+        """Cached serialized form (shared, do not mutate)"""
+        key = _MEMBER_KEY(self)
+        data = self._cached_dict
+        if data is None or key != self._cached_key:
+            data = {
+                "prim_path": self.prim_path,
+                "light_type": _LIGHT_TYPE_VALUE[self.light_type],
+                "enabled": self.enabled,
+                "solo": self.solo,
+                "contribution": self.contribution,
+            }
+            self._cached_dict = data
+            self._cached_key = key
+        return data
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "prim_path": self.prim_path,
-            "light_type": self.light_type.value,
-            "enabled": self.enabled,
-            "solo": self.solo,
-            "contribution": self.contribution,
-        }
+        return dict(self._serialized())
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (orjson when available)"""
+        return _dumps(self._serialized())
+
+    def reset(self, prim_path: str, light_type: LightType) -> None:
+        """Re-initialize in place with default settings (for member pooling)"""
+        self.prim_path = intern_str(prim_path)
+        self.light_type = light_type
+        self.enabled = True
+        self.solo = False
+        self.contribution = 1.0
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LightGroupMember':
+        get = data.get
         return cls(
-            prim_path=data["prim_path"],
-            light_type=LightType(data["light_type"]),
-            enabled=data.get("enabled", True),
-            solo=data.get("solo", False),
-            contribution=data.get("contribution", 1.0),
+            prim_path=intern_str(data["prim_path"]),
+            light_type=_enum_from_value(_LIGHT_TYPE_BY_VALUE, LightType, data["light_type"]),
+            enabled=get("enabled", True),
+            solo=get("solo", False),
+            contribution=get("contribution", 1.0),
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class LightGroup:
     """
     A named collection of lights for isolation/control.
@@ -140,25 +276,155 @@ class LightGroup:
     group_id: str = ""
     created_by: str = ""  # Agent or user who created
 
+    # Serialized form, reused while the field snapshot it was built from still matches
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_key: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # prim_path -> member lookup, built lazily and kept in step by
+    # add_light/add_lights_bulk/pop_light (None while paths are duplicated)
+    _path_index: Optional[Dict[str, LightGroupMember]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # (name, interned selector) from the last get_lpe_light_selector() call
+    _lpe_selector: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    __reduce__ = _reduce_init_fields
+
     def __post_init__(self):
         if not self.group_id:
             content = f"{self.name}:{self.role.value}:{len(self.members)}"
             self.group_id = deterministic_uuid(content, "lightgroup")
         self.intensity_mult = round_float(self.intensity_mult, 4)
 
-    def add_light(self, prim_path: str, light_type: LightType) -> LightGroupMember:
-        """Add light to group"""
-        member = LightGroupMember(prim_path=prim_path, light_type=light_type)
+    def add_light(
+        self,
+        prim_path: str,
+        light_type: LightType,
+        member: Optional[LightGroupMember] = None,
+    ) -> LightGroupMember:
+        """
+        Add light to group.
+
+        A spare member (e.g. from a pool) can be passed in; it is reset
+        in place instead of allocating a new one.
+        """
+        if member is None:
+            member = LightGroupMember(prim_path=intern_str(prim_path), light_type=light_type)
+        else:
+            member.reset(prim_path, light_type)
+        index = self._path_index
+        if index is not None and len(index) == len(self.members):
+            if member.prim_path in index:
+                index = None  # Duplicate path: rebuild (or scan) on next lookup
+            else:
+                index[member.prim_path] = member
+            self._path_index = index
         self.members.append(member)
         return member
 
+    def add_lights_bulk(
+        self,
+        lights: Sequence[Tuple[str, LightType]],
+    ) -> List[LightGroupMember]:
+        """
+        Add many lights in one pass.
+
+        Skips prim paths already in the group (or repeated in the input)
+        and extends the member list once.
+
+        Returns:
+            The newly added members
+        """
+        index = self._member_index()
+        seen = set(index) if index is not None else {m.prim_path for m in self.members}
+        added: List[LightGroupMember] = []
+        for prim_path, light_type in lights:
+            if prim_path in seen:
+                continue
+            seen.add(prim_path)
+            member = LightGroupMember(prim_path=intern_str(prim_path), light_type=light_type)
+            added.append(member)
+            if index is not None:
+                index[member.prim_path] = member
+        self.members.extend(added)
+        return added
+
     def remove_light(self, prim_path: str) -> bool:
         """Remove light from group"""
-        for i, member in enumerate(self.members):
+        return self.pop_light(prim_path) is not None
+
+    def remove_lights_bulk(self, prim_paths: Iterable[str]) -> List[LightGroupMember]:
+        """
+        Remove many lights in one pass over the member list.
+
+        Returns:
+            The removed members
+        """
+        targets = set(prim_paths)
+        kept: List[LightGroupMember] = []
+        removed: List[LightGroupMember] = []
+        for member in self.members:
+            (removed if member.prim_path in targets else kept).append(member)
+        if removed:
+            self.members[:] = kept
+            self._path_index = None
+        return removed
+
+    def pop_light(self, prim_path: str) -> Optional[LightGroupMember]:
+        """Remove light from group, returning its member if it was present"""
+        members = self.members
+        index = self._member_index()
+        if index is not None:
+            member = index.get(prim_path)
+            if member is None:
+                return None
+            try:
+                # Identity equality (eq=False), so this scan stays in C
+                i = members.index(member)
+            except ValueError:
+                # Index went stale (members edited directly); fall back to a scan
+                self._path_index = None
+            else:
+                del index[prim_path]
+                return members.pop(i)
+
+        for i, member in enumerate(members):
             if member.prim_path == prim_path:
-                self.members.pop(i)
-                return True
-        return False
+                self._path_index = None
+                return members.pop(i)
+        return None
+
+    def get_member(self, prim_path: str) -> Optional[LightGroupMember]:
+        """Get the member for a prim path"""
+        index = self._member_index()
+        if index is not None:
+            return index.get(prim_path)
+        for member in self.members:
+            if member.prim_path == prim_path:
+                return member
+        return None
+
+    def has_light(self, prim_path: str) -> bool:
+        """Check if a prim path is in the group"""
+        return self.get_member(prim_path) is not None
+
+    def _member_index(self) -> Optional[Dict[str, LightGroupMember]]:
+        """prim_path -> member map, or None if the group has duplicate paths"""
+        members = self.members
+        index = self._path_index
+        if index is None or len(index) != len(members):
+            index = {m.prim_path: m for m in members}
+            if len(index) != len(members):
+                index = None
+            self._path_index = index
+        return index
 
     def get_prim_paths(self) -> List[str]:
         """Get all light prim paths in group"""
@@ -171,13 +437,34 @@ class LightGroup:
         For Karma: Uses 'lightgroup:groupname' syntax
         Returns the selector string for use in LPE expressions.
         """
-        return f"'lightgroup:{self.name}'"
+        cached = self._lpe_selector
+        if cached is not None and cached[0] == self.name:
+            return cached[1]
+        selector = sys.intern(f"'lightgroup:{self.name}'")
+        self._lpe_selector = (self.name, selector)
+        return selector
+
+    def _serialized(self) -> Dict[str, Any]:
+        """
+        Cached serialized form (shared, do not mutate).
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+        Reused while the group's own fields are unchanged and every member
+        still serializes to the exact dict it contributed.
+        """
+        members = self.members
+        key = _GROUP_KEY(self)
+        data = self._cached_dict
+        if data is not None and key == self._cached_key:
+            cached_members = data["members"]
+            if len(cached_members) == len(members) and all(
+                m._serialized() is d for m, d in zip(members, cached_members)
+            ):
+                return data
+
+        data = {
             "name": self.name,
-            "role": self.role.value,
-            "members": [m.to_dict() for m in self.members],
+            "role": _LIGHT_ROLE_VALUE[self.role],
+            "members": list(map(LightGroupMember._serialized, members)),
             "color_tag": self.color_tag,
             "description": self.description,
             "enabled": self.enabled,
@@ -190,28 +477,41 @@ class LightGroup:
             "group_id": self.group_id,
             "created_by": self.created_by,
         }
+        self._cached_dict = data
+        self._cached_key = key
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = dict(self._serialized())
+        data["members"] = list(map(dict, data["members"]))
+        return data
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (orjson when available)"""
+        return _dumps(self._serialized())
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LightGroup':
+        get = data.get
         return cls(
-            name=data["name"],
-            role=LightRole(data.get("role", "custom")),
-            members=[LightGroupMember.from_dict(m) for m in data.get("members", [])],
-            color_tag=data.get("color_tag", "#FFFFFF"),
-            description=data.get("description", ""),
-            enabled=data.get("enabled", True),
-            intensity_mult=data.get("intensity_mult", 1.0),
-            generate_beauty=data.get("generate_beauty", True),
-            generate_diffuse=data.get("generate_diffuse", True),
-            generate_specular=data.get("generate_specular", True),
-            generate_shadow=data.get("generate_shadow", False),
-            generate_transmission=data.get("generate_transmission", False),
-            group_id=data.get("group_id", ""),
-            created_by=data.get("created_by", ""),
+            name=intern_str(data["name"]),
+            role=_enum_from_value(_LIGHT_ROLE_BY_VALUE, LightRole, get("role", "custom")),
+            members=list(map(LightGroupMember.from_dict, get("members", ()))),
+            color_tag=intern_str(get("color_tag", "#FFFFFF")),
+            description=get("description", ""),
+            enabled=get("enabled", True),
+            intensity_mult=get("intensity_mult", 1.0),
+            generate_beauty=get("generate_beauty", True),
+            generate_diffuse=get("generate_diffuse", True),
+            generate_specular=get("generate_specular", True),
+            generate_shadow=get("generate_shadow", False),
+            generate_transmission=get("generate_transmission", False),
+            group_id=get("group_id", ""),
+            created_by=get("created_by", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class AOVDefinition:
     """
     AOV/render variable definition.
@@ -240,6 +540,16 @@ class AOVDefinition:
     aov_id: str = ""
     description: str = ""
 
+    # Serialized form, reused while the field snapshot it was built from still matches
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_key: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    __reduce__ = _reduce_init_fields
+
     def __post_init__(self):
         if not self.aov_id:
             content = f"{self.name}:{self.lpe or self.source}"
@@ -247,58 +557,62 @@ class AOVDefinition:
         if not self.comp_layer_name:
             self.comp_layer_name = self.name
 
-    def get_karma_driver_settings(self) -> Dict[str, Any]:
-        """Get settings for Karma render product configuration"""
-        settings = {
-            "name": self.name,
-            "type": self.aov_type.value,
-        }
-
-        if self.lpe:
-            settings["lpe"] = self.lpe
-        elif self.source:
-            settings["source"] = self.source
-
-        if self.filter_type != "box":
-            settings["filter"] = self.filter_type
+    def get_karma_driver_settings(self) -> Mapping[str, Any]:
+        """Get settings for Karma render product configuration (read-only, shared)"""
+        return _karma_driver_settings(
+            self.name, self.aov_type, self.lpe, self.source, self.filter_type
+        )
 
-        return settings
+    def _serialized(self) -> Dict[str, Any]:
+        """Cached serialized form (shared, do not mutate)"""
+        key = _AOV_KEY(self)
+        data = self._cached_dict
+        if data is None or key != self._cached_key:
+            data = {
+                "name": self.name,
+                "aov_type": _AOV_TYPE_VALUE[self.aov_type],
+                "lpe": self.lpe,
+                "source": self.source,
+                "comp_layer_name": self.comp_layer_name,
+                "comp_merge_mode": self.comp_merge_mode,
+                "light_group": self.light_group,
+                "enabled": self.enabled,
+                "denoise": self.denoise,
+                "filter_type": self.filter_type,
+                "aov_id": self.aov_id,
+                "description": self.description,
+            }
+            self._cached_dict = data
+            self._cached_key = key
+        return data
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "aov_type": self.aov_type.value,
-            "lpe": self.lpe,
-            "source": self.source,
-            "comp_layer_name": self.comp_layer_name,
-            "comp_merge_mode": self.comp_merge_mode,
-            "light_group": self.light_group,
-            "enabled": self.enabled,
-            "denoise": self.denoise,
-            "filter_type": self.filter_type,
-            "aov_id": self.aov_id,
-            "description": self.description,
-        }
+        return dict(self._serialized())
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (orjson when available)"""
+        return _dumps(self._serialized())
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AOVDefinition':
+        get = data.get
         return cls(
-            name=data["name"],
-            aov_type=AOVType(data.get("aov_type", "color3f")),
-            lpe=data.get("lpe", ""),
-            source=data.get("source", ""),
-            comp_layer_name=data.get("comp_layer_name", ""),
-            comp_merge_mode=data.get("comp_merge_mode", "plus"),
-            light_group=data.get("light_group", ""),
-            enabled=data.get("enabled", True),
-            denoise=data.get("denoise", False),
-            filter_type=data.get("filter_type", "box"),
-            aov_id=data.get("aov_id", ""),
-            description=data.get("description", ""),
+            name=intern_str(data["name"]),
+            aov_type=_enum_from_value(_AOV_TYPE_BY_VALUE, AOVType, get("aov_type", "color3f")),
+            lpe=get("lpe", ""),
+            source=get("source", ""),
+            comp_layer_name=intern_str(get("comp_layer_name", "")),
+            comp_merge_mode=intern_str(get("comp_merge_mode", "plus")),
+            light_group=intern_str(get("light_group", "")),
+            enabled=get("enabled", True),
+            denoise=get("denoise", False),
+            filter_type=intern_str(get("filter_type", "box")),
+            aov_id=get("aov_id", ""),
+            description=get("description", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class AOVBundle:
     """
     A preset collection of AOVs for common workflows.
@@ -319,6 +633,8 @@ class AOVBundle:
     # Metadata
     bundle_id: str = ""
 
+    __reduce__ = _reduce_init_fields
+
     def __post_init__(self):
         if not self.bundle_id:
             content = f"{self.name}:{self.workflow}:{len(self.aovs)}"
@@ -328,25 +644,38 @@ class AOVBundle:
         return {
             "name": self.name,
             "description": self.description,
-            "aovs": [a.to_dict() for a in self.aovs],
+            "aovs": list(map(AOVDefinition.to_dict, self.aovs)),
             "workflow": self.workflow,
             "per_light_group": self.per_light_group,
             "bundle_id": self.bundle_id,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (orjson when available)"""
+        # Encode the AOVs' cached dicts directly; no per-AOV copies
+        return _dumps({
+            "name": self.name,
+            "description": self.description,
+            "aovs": list(map(AOVDefinition._serialized, self.aovs)),
+            "workflow": self.workflow,
+            "per_light_group": self.per_light_group,
+            "bundle_id": self.bundle_id,
+        })
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AOVBundle':
+        get = data.get
         return cls(
             name=data["name"],
-            description=data.get("description", ""),
-            aovs=[AOVDefinition.from_dict(a) for a in data.get("aovs", [])],
-            workflow=data.get("workflow", "comp"),
-            per_light_group=data.get("per_light_group", False),
-            bundle_id=data.get("bundle_id", ""),
+            description=get("description", ""),
+            aovs=list(map(AOVDefinition.from_dict, get("aovs", ()))),
+            workflow=get("workflow", "comp"),
+            per_light_group=get("per_light_group", False),
+            bundle_id=get("bundle_id", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class LightLinkRule:
     """
     Light linking/shadow linking rule.
@@ -370,34 +699,59 @@ class LightLinkRule:
     rule_id: str = ""
     description: str = ""
 
+    # Serialized form, reused while the field snapshot it was built from still matches
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_key: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    __reduce__ = _reduce_init_fields
+
     def __post_init__(self):
         if not self.rule_id:
             content = f"{self.name}:{self.light_pattern}:{self.geometry_pattern}"
             self.rule_id = deterministic_uuid(content, "linkrule")
 
+    def _serialized(self) -> Dict[str, Any]:
+        """Cached serialized form (shared, do not mutate)"""
+        key = _RULE_KEY(self)
+        data = self._cached_dict
+        if data is None or key != self._cached_key:
+            data = {
+                "name": self.name,
+                "light_pattern": self.light_pattern,
+                "geometry_pattern": self.geometry_pattern,
+                "illumination": self.illumination,
+                "shadow": self.shadow,
+                "include": self.include,
+                "priority": self.priority,
+                "rule_id": self.rule_id,
+                "description": self.description,
+            }
+            self._cached_dict = data
+            self._cached_key = key
+        return data
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "light_pattern": self.light_pattern,
-            "geometry_pattern": self.geometry_pattern,
-            "illumination": self.illumination,
-            "shadow": self.shadow,
-            "include": self.include,
-            "priority": self.priority,
-            "rule_id": self.rule_id,
-            "description": self.description,
-        }
+        return dict(self._serialized())
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (orjson when available)"""
+        return _dumps(self._serialized())
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LightLinkRule':
+        get = data.get
         return cls(
             name=data["name"],
             light_pattern=data["light_pattern"],
             geometry_pattern=data["geometry_pattern"],
-            illumination=data.get("illumination", True),
-            shadow=data.get("shadow", True),
-            include=data.get("include", True),
-            priority=data.get("priority", 0),
-            rule_id=data.get("rule_id", ""),
-            description=data.get("description", ""),
+            illumination=get("illumination", True),
+            shadow=get("shadow", True),
+            include=get("include", True),
+            priority=get("priority", 0),
+            rule_id=get("rule_id", ""),
+            description=get("description", ""),
         )
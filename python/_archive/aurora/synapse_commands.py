@@ -14,24 +14,59 @@ Command Types:
 - aurora_set_bundle: Set active AOV bundle
 - aurora_get_aovs: Get all AOVs for current config
 - aurora_add_link_rule: Add light linking rule
+- aurora_add_link_rules: Add several light linking rules at once
 - aurora_get_pending: Get pending gate proposals
 - aurora_approve: Approve gate proposal
 - aurora_reject: Reject gate proposal
 """
 
-from typing import Dict, Any, Optional, List
+from functools import partialmethod
+from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 
 from .manager import aurora, AuroraManager
-from .models import LightType, LightRole, AOVType
+from .models import (
+    LightType, LightRole, AOVType, LightLinkRule,
+    _LIGHT_TYPE_BY_VALUE, _LIGHT_ROLE_BY_VALUE, _AOV_TYPE_BY_VALUE,
+)
 from .linking import LinkMode
 
 from core.gates import human_gate, GateDecision, GateLevel
 from core.audit import audit_log, AuditCategory, AuditLevel
 
 
-class AuroraCommandType(Enum):
-    """Aurora command types for Synapse protocol"""
+def _parse_light(light_data: Any) -> Tuple[str, LightType]:
+    """(prim_path, light_type) from a payload entry; a bare string is a RectLight path"""
+    if type(light_data) is str:
+        return light_data, LightType.RECT
+    get = light_data.get
+    prim_path = get("prim_path")
+    if prim_path is None:
+        prim_path = get("path", "")
+    light_type_str = get("light_type")
+    if light_type_str is None:
+        light_type_str = get("type")
+    return prim_path, _LIGHT_TYPE_BY_VALUE.get(light_type_str, LightType.RECT)
+
+
+def _not_found(key: str, value: Any, message: str) -> Dict:
+    """Error payload for an expected miss; Synapse turns ok=False into a failed response"""
+    return {"ok": False, "error": "not_found", "message": message, key: value}
+
+
+# Payload string -> enum member (plain dict lookups, no Enum.__call__)
+_GATE_LEVEL_BY_VALUE: Dict[str, GateLevel] = {m.value: m for m in GateLevel}
+_LINK_MODE_BY_VALUE: Dict[str, LinkMode] = {m.value: m for m in LinkMode}
+
+
+class AuroraCommandType(str, Enum):
+    """
+    Aurora command types for Synapse protocol.
+
+    Members are str, so they compare and hash equal to the wire command
+    names. Registry keys use .value anyway, so registries and logs see
+    plain strings rather than enum members.
+    """
     # Light Group Management
     CREATE_GROUP = "aurora_create_group"
     ADD_LIGHT = "aurora_add_light"
@@ -50,6 +85,7 @@ class AuroraCommandType(Enum):
 
     # Light Linking
     ADD_LINK_RULE = "aurora_add_link_rule"
+    ADD_LINK_RULES = "aurora_add_link_rules"
     REMOVE_LINK_RULE = "aurora_remove_link_rule"
     GET_LINK_RULES = "aurora_get_link_rules"
     SET_LINK_MODE = "aurora_set_link_mode"
@@ -79,119 +115,69 @@ class AuroraCommandHandler:
         # Commands are then available via WebSocket
     """
 
-    def __init__(self):
-        self._mgr = aurora()
-
-    def register_with_synapse(self, registry) -> None:
-        """Register all Aurora commands with Synapse registry"""
-
+    # (command, handler method, validator method or None)
+    _COMMAND_TABLE = (
         # Light Group Management
-        registry.register(
-            AuroraCommandType.CREATE_GROUP.value,
-            self._handle_create_group,
-            self._validate_create_group
-        )
-        registry.register(
-            AuroraCommandType.ADD_LIGHT.value,
-            self._handle_add_light,
-            self._validate_add_light
-        )
-        registry.register(
-            AuroraCommandType.REMOVE_LIGHT.value,
-            self._handle_remove_light
-        )
-        registry.register(
-            AuroraCommandType.DELETE_GROUP.value,
-            self._handle_delete_group
-        )
-        registry.register(
-            AuroraCommandType.AUTO_GROUP.value,
-            self._handle_auto_group
-        )
-        registry.register(
-            AuroraCommandType.GET_GROUPS.value,
-            self._handle_get_groups
-        )
-        registry.register(
-            AuroraCommandType.GET_GROUP.value,
-            self._handle_get_group
-        )
+        (AuroraCommandType.CREATE_GROUP, "_handle_create_group", "_validate_create_group"),
+        (AuroraCommandType.ADD_LIGHT, "_handle_add_light", "_validate_add_light"),
+        (AuroraCommandType.REMOVE_LIGHT, "_handle_remove_light", None),
+        (AuroraCommandType.DELETE_GROUP, "_handle_delete_group", None),
+        (AuroraCommandType.AUTO_GROUP, "_handle_auto_group", None),
+        (AuroraCommandType.GET_GROUPS, "_handle_get_groups", None),
+        (AuroraCommandType.GET_GROUP, "_handle_get_group", None),
 
         # AOV Management
-        registry.register(
-            AuroraCommandType.SET_BUNDLE.value,
-            self._handle_set_bundle
-        )
-        registry.register(
-            AuroraCommandType.GET_BUNDLES.value,
-            self._handle_get_bundles
-        )
-        registry.register(
-            AuroraCommandType.GET_AOVS.value,
-            self._handle_get_aovs
-        )
-        registry.register(
-            AuroraCommandType.ADD_CUSTOM_AOV.value,
-            self._handle_add_custom_aov
-        )
-        registry.register(
-            AuroraCommandType.TOGGLE_AOV.value,
-            self._handle_toggle_aov
-        )
+        (AuroraCommandType.SET_BUNDLE, "_handle_set_bundle", None),
+        (AuroraCommandType.GET_BUNDLES, "_handle_get_bundles", None),
+        (AuroraCommandType.GET_AOVS, "_handle_get_aovs", None),
+        (AuroraCommandType.ADD_CUSTOM_AOV, "_handle_add_custom_aov", None),
+        (AuroraCommandType.TOGGLE_AOV, "_handle_toggle_aov", None),
 
         # Light Linking
-        registry.register(
-            AuroraCommandType.ADD_LINK_RULE.value,
-            self._handle_add_link_rule
-        )
-        registry.register(
-            AuroraCommandType.REMOVE_LINK_RULE.value,
-            self._handle_remove_link_rule
-        )
-        registry.register(
-            AuroraCommandType.GET_LINK_RULES.value,
-            self._handle_get_link_rules
-        )
-        registry.register(
-            AuroraCommandType.SET_LINK_MODE.value,
-            self._handle_set_link_mode
-        )
+        (AuroraCommandType.ADD_LINK_RULE, "_handle_add_link_rule", None),
+        (AuroraCommandType.ADD_LINK_RULES, "_handle_add_link_rules", None),
+        (AuroraCommandType.REMOVE_LINK_RULE, "_handle_remove_link_rule", None),
+        (AuroraCommandType.GET_LINK_RULES, "_handle_get_link_rules", None),
+        (AuroraCommandType.SET_LINK_MODE, "_handle_set_link_mode", None),
 
         # Gate/Approval
-        registry.register(
-            AuroraCommandType.GET_PENDING.value,
-            self._handle_get_pending
-        )
-        registry.register(
-            AuroraCommandType.APPROVE.value,
-            self._handle_approve
-        )
-        registry.register(
-            AuroraCommandType.REJECT.value,
-            self._handle_reject
-        )
-        registry.register(
-            AuroraCommandType.APPROVE_ALL.value,
-            self._handle_approve_all
-        )
+        (AuroraCommandType.GET_PENDING, "_handle_get_pending", None),
+        (AuroraCommandType.APPROVE, "_handle_approve", None),
+        (AuroraCommandType.REJECT, "_handle_reject", None),
+        (AuroraCommandType.APPROVE_ALL, "_handle_approve_all", None),
 
         # Session
-        registry.register(
-            AuroraCommandType.SET_SEQUENCE.value,
-            self._handle_set_sequence
-        )
-        registry.register(
-            AuroraCommandType.GET_SESSION.value,
-            self._handle_get_session
-        )
-        registry.register(
-            AuroraCommandType.SAVE_SESSION.value,
-            self._handle_save_session
-        )
-        registry.register(
-            AuroraCommandType.LOAD_SESSION.value,
-            self._handle_load_session
-        )
+        (AuroraCommandType.SET_SEQUENCE, "_handle_set_sequence", None),
+        (AuroraCommandType.GET_SESSION, "_handle_get_session", None),
+        (AuroraCommandType.SAVE_SESSION, "_handle_save_session", None),
+        (AuroraCommandType.LOAD_SESSION, "_handle_load_session", None),
+    )
+
+    def __init__(self):
+        self._mgr = aurora()
+        # The manager keeps one linker for its lifetime (loads update it in
+        # place); the session object is replaced on load, so it is not cached
+        self._linker = self._mgr.linker
+
+    def register_with_synapse(self, registry) -> None:
+        """Register all Aurora commands with Synapse registry"""
+
+        entries = [
+            (
+                command.value,
+                getattr(self, handler_name),
+                getattr(self, validator_name) if validator_name else None,
+            )
+            for command, handler_name, validator_name in self._COMMAND_TABLE
+        ]
+
+        register_many = getattr(registry, "register_many", None)
+        if register_many is not None:
+            register_many(entries)
+        else:
+            # Older Synapse registries only expose register()
+            for command_type, handler, validator in entries:
+                registry.register(command_type, handler, validator)
 
         audit_log().log(
             operation="aurora_synapse_register",
@@ -228,28 +214,10 @@ class AuroraCommandHandler:
         reasoning = payload.get("reasoning", "")
         confidence = payload.get("confidence", 0.8)
 
-        # Parse role
-        try:
-            role = LightRole(role_str)
-        except ValueError:
-            role = LightRole.CUSTOM
-
-        # Parse gate level
-        try:
-            gate_level = GateLevel(gate_level_str)
-        except ValueError:
-            gate_level = GateLevel.REVIEW
-
-        # Parse lights
-        lights = []
-        for light_data in lights_data:
-            prim_path = light_data.get("prim_path", light_data.get("path", ""))
-            light_type_str = light_data.get("light_type", light_data.get("type", "RectLight"))
-            try:
-                light_type = LightType(light_type_str)
-            except ValueError:
-                light_type = LightType.RECT
-            lights.append((prim_path, light_type))
+        role = _LIGHT_ROLE_BY_VALUE.get(role_str, LightRole.CUSTOM)
+        gate_level = _GATE_LEVEL_BY_VALUE.get(gate_level_str, GateLevel.REVIEW)
+
+        lights = list(map(_parse_light, lights_data))
 
         group, proposal = self._mgr.create_light_group(
             name=name,
@@ -274,10 +242,7 @@ class AuroraCommandHandler:
         prim_path = payload["prim_path"]
         light_type_str = payload.get("light_type", "RectLight")
 
-        try:
-            light_type = LightType(light_type_str)
-        except ValueError:
-            light_type = LightType.RECT
+        light_type = _LIGHT_TYPE_BY_VALUE.get(light_type_str, LightType.RECT)
 
         proposal = self._mgr.add_light_to_group(group_name, prim_path, light_type)
 
@@ -317,10 +282,7 @@ class AuroraCommandHandler:
         light_type_map = payload.get("light_type_map", {})
         gate_level_str = payload.get("gate_level", "review")
 
-        try:
-            gate_level = GateLevel(gate_level_str)
-        except ValueError:
-            gate_level = GateLevel.REVIEW
+        gate_level = _GATE_LEVEL_BY_VALUE.get(gate_level_str, GateLevel.REVIEW)
 
         groups, proposal = self._mgr.auto_group_lights(
             light_paths, light_type_map, gate_level
@@ -333,12 +295,17 @@ class AuroraCommandHandler:
         }
 
     def _handle_get_groups(self, payload: Dict) -> Dict:
-        """Get all light groups"""
+        """Get all light groups (pass since_version to skip unchanged state)"""
+        version = self._mgr.state_version
+        if payload.get("since_version") == version:
+            return {"unchanged": True, "version": version}
+
         groups = self._mgr.get_light_groups()
 
         return {
             "groups": [g.to_dict() for g in groups],
             "count": len(groups),
+            "version": version,
         }
 
     def _handle_get_group(self, payload: Dict) -> Dict:
@@ -347,7 +314,7 @@ class AuroraCommandHandler:
         group = self._mgr.get_light_group(name)
 
         if not group:
-            raise ValueError(f"Light group not found: {name}")
+            return _not_found("name", name, f"Light group not found: {name}")
 
         return {
             "group": group.to_dict(),
@@ -361,7 +328,7 @@ class AuroraCommandHandler:
         result = self._mgr.set_active_bundle(bundle_name)
 
         if not result:
-            raise ValueError(f"Unknown bundle: {bundle_name}")
+            return _not_found("bundle", bundle_name, f"Unknown bundle: {bundle_name}")
 
         return {
             "active_bundle": bundle_name,
@@ -377,13 +344,18 @@ class AuroraCommandHandler:
         }
 
     def _handle_get_aovs(self, payload: Dict) -> Dict:
-        """Get all AOVs for current config"""
+        """Get all AOVs for current config (pass since_version to skip unchanged state)"""
+        version = self._mgr.state_version
+        if payload.get("since_version") == version:
+            return {"unchanged": True, "version": version}
+
         aovs = self._mgr.get_all_aovs()
 
         return {
             "aovs": [a.to_dict() for a in aovs],
             "count": len(aovs),
             "active_bundle": self._mgr.session.active_bundle,
+            "version": version,
         }
 
     def _handle_add_custom_aov(self, payload: Dict) -> Dict:
@@ -393,10 +365,7 @@ class AuroraCommandHandler:
         source = payload.get("source", "")
         aov_type_str = payload.get("aov_type", "color3f")
 
-        try:
-            aov_type = AOVType(aov_type_str)
-        except ValueError:
-            aov_type = AOVType.COLOR3F
+        aov_type = _AOV_TYPE_BY_VALUE.get(aov_type_str, AOVType.COLOR3F)
 
         aov = self._mgr.add_custom_aov(name, lpe, source, aov_type)
 
@@ -418,36 +387,43 @@ class AuroraCommandHandler:
 
     # Light Linking Handlers
 
+    @staticmethod
+    def _rule_from_payload(payload: Dict) -> LightLinkRule:
+        get = payload.get
+        return LightLinkRule(
+            name=payload["name"],
+            light_pattern=payload["light_pattern"],
+            geometry_pattern=payload["geometry_pattern"],
+            illumination=get("illumination", True),
+            shadow=get("shadow", True),
+            include=get("include", True),
+            priority=get("priority", 0),
+            description=get("description", ""),
+        )
+
     def _handle_add_link_rule(self, payload: Dict) -> Dict:
         """Add light linking rule"""
-        name = payload["name"]
-        light_pattern = payload["light_pattern"]
-        geometry_pattern = payload["geometry_pattern"]
-        illumination = payload.get("illumination", True)
-        shadow = payload.get("shadow", True)
-        include = payload.get("include", True)
-        priority = payload.get("priority", 0)
-        description = payload.get("description", "")
-
-        rule = self._mgr.linker.create_rule(
-            name=name,
-            light_pattern=light_pattern,
-            geometry_pattern=geometry_pattern,
-            illumination=illumination,
-            shadow=shadow,
-            include=include,
-            priority=priority,
-            description=description,
-        )
+        rule = self._rule_from_payload(payload)
+        self._linker.add_rule(rule)
 
         return {
             "rule": rule.to_dict(),
         }
 
+    def _handle_add_link_rules(self, payload: Dict) -> Dict:
+        """Add a burst of light linking rules in one call"""
+        rules = [self._rule_from_payload(r) for r in payload["rules"]]
+        self._linker.add_rules(rules)
+
+        return {
+            "rules": [r.to_dict() for r in rules],
+            "count": len(rules),
+        }
+
     def _handle_remove_link_rule(self, payload: Dict) -> Dict:
         """Remove light linking rule"""
         rule_id = payload["rule_id"]
-        result = self._mgr.linker.remove_rule(rule_id)
+        result = self._linker.remove_rule(rule_id)
 
         return {
             "removed": result,
@@ -456,20 +432,20 @@ class AuroraCommandHandler:
 
     def _handle_get_link_rules(self, payload: Dict) -> Dict:
         """Get all linking rules"""
-        rules = self._mgr.linker.get_rules()
+        linker = self._linker
+        rules = linker.get_rules()
 
         return {
             "rules": [r.to_dict() for r in rules],
-            "mode": self._mgr.linker.mode.value,
+            "mode": linker.mode.value,
         }
 
     def _handle_set_link_mode(self, payload: Dict) -> Dict:
         """Set light linking mode"""
         mode_str = payload["mode"]
 
-        try:
-            mode = LinkMode(mode_str)
-        except ValueError:
+        mode = _LINK_MODE_BY_VALUE.get(mode_str)
+        if mode is None:
             raise ValueError(f"Unknown link mode: {mode_str}")
 
         self._mgr.set_link_mode(mode)
@@ -490,41 +466,25 @@ class AuroraCommandHandler:
             "count": len(proposals),
         }
 
-    def _handle_approve(self, payload: Dict) -> Dict:
-        """Approve gate proposal"""
+    def _handle_decide(self, payload: Dict, decision: GateDecision) -> Dict:
+        """Record a human decision on a gate proposal"""
         proposal_id = payload["proposal_id"]
         user_id = payload.get("user_id", "synapse_user")
         notes = payload.get("notes", "")
 
-        proposal = human_gate().decide(
-            proposal_id, GateDecision.APPROVED, user_id, notes
-        )
+        proposal = human_gate().decide(proposal_id, decision, user_id, notes)
 
         if not proposal:
-            raise ValueError(f"Proposal not found: {proposal_id}")
+            return _not_found("proposal_id", proposal_id, f"Proposal not found: {proposal_id}")
 
         return {
             "proposal_id": proposal_id,
             "decision": proposal.decision.value,
         }
 
-    def _handle_reject(self, payload: Dict) -> Dict:
-        """Reject gate proposal"""
-        proposal_id = payload["proposal_id"]
-        user_id = payload.get("user_id", "synapse_user")
-        notes = payload.get("notes", "")
-
-        proposal = human_gate().decide(
-            proposal_id, GateDecision.REJECTED, user_id, notes
-        )
-
-        if not proposal:
-            raise ValueError(f"Proposal not found: {proposal_id}")
-
-        return {
-            "proposal_id": proposal_id,
-            "decision": proposal.decision.value,
-        }
+    # Approve / reject gate proposal
+    _handle_approve = partialmethod(_handle_decide, decision=GateDecision.APPROVED)
+    _handle_reject = partialmethod(_handle_decide, decision=GateDecision.REJECTED)
 
     def _handle_approve_all(self, payload: Dict) -> Dict:
         """Approve all pending proposals for sequence"""
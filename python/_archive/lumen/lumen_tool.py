@@ -13,7 +13,7 @@
 ║                                                                               ║
 ╚═══════════════════════════════════════════════════════════════════════════════╝
 
-Lumen v2.1.0 | Houdini 21+ | Python 3.9+
+Lumen v2.1.0 | Houdini 21+ | Python 3.10+
 
 Complete lighting rig management for Solaris/USD workflows.
 Create, save, and deploy professional lighting setups in seconds.
@@ -42,17 +42,26 @@ __license__ = "MIT"
 __product__ = "Lumen - Lighting Rig Manager"
 
 import hou
+import os
 import math
+import atexit
+import weakref
 import json
+import pickle
 import threading
 import traceback
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable
 from dataclasses import dataclass, field, asdict
+from datetime import datetime
 from enum import Enum
 from PySide6 import QtWidgets, QtCore, QtGui
 
 SCHEMA_VERSION = "2.1.0"
+SAVE_BUFFER_SIZE = 256 * 1024
+SAVE_DEBOUNCE_SECONDS = 0.5  # Coalesce bursts of rig edits into one write
+WAL_COMPACT_THRESHOLD = 64  # Rewrite rigs.json once the edit log grows past this
 
 
 # =============================================================================
@@ -105,6 +114,20 @@ class Renderer(Enum):
     VRAY = "vray"
 
 
+# Value -> member tables for from_dict (avoid Enum.__call__ per light)
+_LIGHT_TYPE_BY_VALUE = {m.value: m for m in LightType}
+_LIGHT_ROLE_BY_VALUE = {m.value: m for m in LightRole}
+_RENDERER_BY_VALUE = {m.value: m for m in Renderer}
+
+
+def _enum_from_value(table: Dict[str, Enum], enum_cls, value) -> Enum:
+    member = table.get(value)
+    if member is None:
+        # Preserve Enum's ValueError for unknown values
+        return enum_cls(value)
+    return member
+
+
 # =============================================================================
 # COLOR TEMPERATURE
 # =============================================================================
@@ -116,8 +139,12 @@ class ColorTemperature:
         "daylight": 5600, "cloudy": 6500, "shade": 7500, "blue_sky": 10000,
     }
     
-    @classmethod
-    def kelvin_to_rgb(cls, kelvin: float) -> Tuple[float, float, float]:
+    # Filled in below the class from kelvin_to_rgb
+    PRESET_RGB: Dict[str, Tuple[float, float, float]] = {}
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def kelvin_to_rgb(kelvin: float) -> Tuple[float, float, float]:
         kelvin = max(1000, min(40000, kelvin))
         temp = kelvin / 100.0
         
@@ -149,11 +176,21 @@ class ColorTemperature:
         return (red, green, blue)
 
 
+ColorTemperature.PRESET_RGB = {
+    name: ColorTemperature.kelvin_to_rgb(kelvin)
+    for name, kelvin in ColorTemperature.PRESETS.items()
+}
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+_ZERO3 = (0.0, 0.0, 0.0)
+_ONE3 = (1.0, 1.0, 1.0)
+
+
+@dataclass(slots=True)
 class LightTransform:
     position: Tuple[float, float, float] = (0.0, 0.0, 0.0)
     rotation: Tuple[float, float, float] = (0.0, 0.0, 0.0)
@@ -164,14 +201,19 @@ class LightTransform:
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'LightTransform':
+        # Missing keys share the immutable default tuples instead of building new ones
+        get = data.get
+        position = get("position")
+        rotation = get("rotation")
+        scale = get("scale")
         return cls(
-            position=tuple(data.get("position", [0, 0, 0])),
-            rotation=tuple(data.get("rotation", [0, 0, 0])),
-            scale=tuple(data.get("scale", [1, 1, 1]))
+            position=_ZERO3 if position is None else tuple(position),
+            rotation=_ZERO3 if rotation is None else tuple(rotation),
+            scale=_ONE3 if scale is None else tuple(scale)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LightSettings:
     name: str
     light_type: LightType
@@ -226,18 +268,22 @@ class LightSettings:
             "enabled": self.enabled, "notes": self.notes
         }
     
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'LightSettings':
-        data["light_type"] = LightType(data["light_type"])
-        data["role"] = LightRole(data.get("role", "custom"))
+    @staticmethod
+    def _decode(data: Dict) -> Dict:
+        data["light_type"] = _enum_from_value(_LIGHT_TYPE_BY_VALUE, LightType, data["light_type"])
+        data["role"] = _enum_from_value(_LIGHT_ROLE_BY_VALUE, LightRole, data.get("role", "custom"))
         if "transform" in data:
             data["transform"] = LightTransform.from_dict(data["transform"])
-        data["color"] = tuple(data.get("color", [1, 1, 1]))
-        data["shadow_color"] = tuple(data.get("shadow_color", [0, 0, 0]))
-        return cls(**data)
+        data["color"] = tuple(data.get("color", _ONE3))
+        data["shadow_color"] = tuple(data.get("shadow_color", _ZERO3))
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LightSettings':
+        return cls(**cls._decode(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class LightRig:
     name: str
     lights: List[LightSettings] = field(default_factory=list)
@@ -260,7 +306,7 @@ class LightRig:
         data.pop("_schema_version", None)
         data.pop("_product", None)
         data["lights"] = [LightSettings.from_dict(l) for l in data.get("lights", [])]
-        data["renderer"] = Renderer(data.get("renderer", "karma"))
+        data["renderer"] = _enum_from_value(_RENDERER_BY_VALUE, Renderer, data.get("renderer", "karma"))
         return cls(**data)
 
 
@@ -268,24 +314,110 @@ class LightRig:
 # SOLARIS LIGHT FACTORY
 # =============================================================================
 
+_PARM_NAMES_BY_TYPE: Dict[str, frozenset] = {}
+
+
+def _parm_names_for(node: hou.Node) -> frozenset:
+    """Parm tuple names for node's type, read from the first node of that type"""
+    key = node.type().nameWithCategory()
+    names = _PARM_NAMES_BY_TYPE.get(key)
+    if names is None:
+        names = _PARM_NAMES_BY_TYPE[key] = frozenset(pt.name() for pt in node.parmTuples())
+    return names
+
+
+# Shape parms per light type: settings -> ((parm name, value), ...)
+def _no_type_parms(s: LightSettings) -> Tuple:
+    return ()
+
+
+def _rect_parms(s: LightSettings) -> Tuple:
+    return (("width", s.width), ("height", s.height))
+
+
+def _radius_parms(s: LightSettings) -> Tuple:
+    return (("radius", s.radius),)
+
+
+def _cylinder_parms(s: LightSettings) -> Tuple:
+    return (("radius", s.radius), ("length", s.length))
+
+
+def _dome_parms(s: LightSettings) -> Tuple:
+    return (("texture", s.texture_path),) if s.texture_path else ()
+
+
+_TYPE_PARMS: Dict[LightType, Callable[[LightSettings], Tuple]] = {
+    LightType.RECT: _rect_parms,
+    LightType.DISK: _radius_parms,
+    LightType.SPHERE: _radius_parms,
+    LightType.CYLINDER: _cylinder_parms,
+    LightType.DOME: _dome_parms,
+}
+
+
+def _collect_settings(values: Dict[str, Any], available: frozenset, settings: LightSettings,
+                      shape_parms: Callable[[LightSettings], Tuple]) -> None:
+    """Add settings' parm values to values, keeping only parms the node has"""
+    def put(name: str, value):
+        if name in available:
+            values[name] = value
+    
+    put("intensity", settings.intensity)
+    put("exposure", settings.exposure)
+    put("light_color", settings.get_effective_color())
+    put("normalize", settings.normalize)
+    put("shadow_enable", settings.shadow_enable)
+    
+    for name, value in shape_parms(settings):
+        put(name, value)
+    
+    t = settings.transform
+    put("t", t.position)
+    put("r", t.rotation)
+    put("s", t.scale)
+
+
+def _make_light_factory(node_type: str, type_param: Optional[str],
+                        shape_parms: Callable[[LightSettings], Tuple]) -> Callable:
+    """Bind one LightType's LOP node, type parm and shape parms into a creator"""
+    def create(parent: hou.Node, settings: LightSettings, prim_path: Optional[str]) -> hou.LopNode:
+        light_node = parent.createNode(node_type, settings.name)
+        available = _parm_names_for(light_node)
+        values: Dict[str, Any] = {}
+        
+        # "type" goes first so the shape parms apply to the chosen light type
+        if type_param and "type" in available:
+            values["type"] = type_param
+        if prim_path and "primpath" in available:
+            values["primpath"] = prim_path
+        
+        _collect_settings(values, available, settings, shape_parms)
+        if values:
+            light_node.setParms(values)
+        return light_node
+    
+    return create
+
+
+_LIGHT_FACTORIES: Dict[LightType, Callable] = {
+    lt: _make_light_factory(node_type, type_param, _TYPE_PARMS.get(lt, _no_type_parms))
+    for lt, (node_type, type_param) in LIGHT_TYPE_TO_LOP_NODE.items()
+}
+_DEFAULT_LIGHT_FACTORY = _make_light_factory("light", "point", _no_type_parms)
+
+
 class SolarisLightFactory:
     """Factory for creating USD lights - uses correct LOP nodes"""
     
     @staticmethod
-    def create_light(parent: hou.Node, settings: LightSettings, prim_path: str = None) -> Optional[hou.LopNode]:
+    def create_light(parent: hou.Node, settings: LightSettings, prim_path: str = None,
+                     defer_layout: bool = False) -> Optional[hou.LopNode]:
         try:
-            node_type, type_param = LIGHT_TYPE_TO_LOP_NODE.get(settings.light_type, ("light", "point"))
-            
-            light_node = parent.createNode(node_type, settings.name)
-            
-            if type_param and light_node.parm("type"):
-                light_node.parm("type").set(type_param)
-            
-            if prim_path and light_node.parm("primpath"):
-                light_node.parm("primpath").set(prim_path)
-            
-            SolarisLightFactory._apply_settings(light_node, settings)
-            light_node.moveToGoodPosition()
+            create = _LIGHT_FACTORIES.get(settings.light_type, _DEFAULT_LIGHT_FACTORY)
+            light_node = create(parent, settings, prim_path)
+            if not defer_layout:
+                light_node.moveToGoodPosition()
             return light_node
             
         except Exception as e:
@@ -295,212 +427,393 @@ class SolarisLightFactory:
     
     @staticmethod
     def _apply_settings(light_node: hou.LopNode, settings: LightSettings):
-        if light_node.parm("intensity"):
-            light_node.parm("intensity").set(settings.intensity)
-        
-        if light_node.parm("exposure"):
-            light_node.parm("exposure").set(settings.exposure)
-        
-        color = settings.get_effective_color()
-        if light_node.parm("light_colorr"):
-            light_node.parm("light_colorr").set(color[0])
-            light_node.parm("light_colorg").set(color[1])
-            light_node.parm("light_colorb").set(color[2])
-        elif light_node.parmTuple("light_color"):
-            light_node.parmTuple("light_color").set(color)
-        
-        if light_node.parm("normalize"):
-            light_node.parm("normalize").set(settings.normalize)
-        
-        if light_node.parm("shadow_enable"):
-            light_node.parm("shadow_enable").set(settings.shadow_enable)
-        
-        lt = settings.light_type
-        if lt in [LightType.RECT]:
-            if light_node.parm("width"):
-                light_node.parm("width").set(settings.width)
-            if light_node.parm("height"):
-                light_node.parm("height").set(settings.height)
-        
-        if lt in [LightType.DISK, LightType.SPHERE]:
-            if light_node.parm("radius"):
-                light_node.parm("radius").set(settings.radius)
-        
-        if lt == LightType.CYLINDER:
-            if light_node.parm("radius"):
-                light_node.parm("radius").set(settings.radius)
-            if light_node.parm("length"):
-                light_node.parm("length").set(settings.length)
-        
-        if lt == LightType.DOME and settings.texture_path:
-            if light_node.parm("texture"):
-                light_node.parm("texture").set(settings.texture_path)
-        
-        t = settings.transform
-        if light_node.parmTuple("t"):
-            light_node.parmTuple("t").set(t.position)
-        if light_node.parmTuple("r"):
-            light_node.parmTuple("r").set(t.rotation)
-        if light_node.parmTuple("s"):
-            light_node.parmTuple("s").set(t.scale)
+        values: Dict[str, Any] = {}
+        _collect_settings(values, _parm_names_for(light_node), settings,
+                          _TYPE_PARMS.get(settings.light_type, _no_type_parms))
+        if values:
+            light_node.setParms(values)
 
 
 # =============================================================================
 # RIG MANAGER
 # =============================================================================
 
+# Builtin presets in to_dict() form, built into LightRigs only when needed
+_BUILTIN_PRESETS_RAW: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "Three Point Basic",
+        "notes": "Classic three-point lighting",
+        "lights": (
+            {"name": "key_light", "light_type": "rect", "role": "key",
+             "intensity": 1.5, "temperature": 5600,
+             "transform": {"position": (3.0, 4.0, 3.0), "rotation": (-45.0, 45.0, 0.0)},
+             "width": 2.0, "height": 2.0},
+            {"name": "fill_light", "light_type": "rect", "role": "fill",
+             "intensity": 0.5, "temperature": 6500,
+             "transform": {"position": (-3.0, 2.0, 2.0), "rotation": (-30.0, -45.0, 0.0)},
+             "width": 3.0, "height": 3.0},
+            {"name": "rim_light", "light_type": "rect", "role": "rim",
+             "intensity": 0.8, "temperature": 7500,
+             "transform": {"position": (0.0, 3.0, -4.0), "rotation": (45.0, 180.0, 0.0)},
+             "width": 1.5, "height": 1.5},
+        ),
+    },
+    {
+        "name": "Studio HDRI",
+        "notes": "HDRI dome with accent key",
+        "lights": (
+            {"name": "dome_light", "light_type": "dome", "role": "ambient",
+             "intensity": 1.0, "texture_path": "$HFS/houdini/pic/hdri/HDRIHaven_studio_small_03_1k.rat"},
+            {"name": "key_accent", "light_type": "rect", "role": "key",
+             "intensity": 0.8, "temperature": 5600,
+             "transform": {"position": (2.0, 3.0, 2.0), "rotation": (-40.0, 40.0, 0.0)},
+             "width": 1.5, "height": 1.5},
+        ),
+    },
+    {
+        "name": "Product Shot",
+        "notes": "Soft product photography lighting",
+        "lights": (
+            {"name": "main_soft", "light_type": "rect", "role": "key",
+             "intensity": 2.0, "temperature": 5600,
+             "transform": {"position": (0.0, 5.0, 3.0), "rotation": (-60.0, 0.0, 0.0)},
+             "width": 4.0, "height": 4.0},
+            {"name": "side_fill_left", "light_type": "rect", "role": "fill",
+             "intensity": 0.6,
+             "transform": {"position": (-3.0, 2.0, 0.0), "rotation": (0.0, -90.0, 0.0)},
+             "width": 2.0, "height": 3.0},
+            {"name": "side_fill_right", "light_type": "rect", "role": "fill",
+             "intensity": 0.6,
+             "transform": {"position": (3.0, 2.0, 0.0), "rotation": (0.0, 90.0, 0.0)},
+             "width": 2.0, "height": 3.0},
+            {"name": "back_rim", "light_type": "rect", "role": "rim",
+             "intensity": 1.2, "temperature": 7000,
+             "transform": {"position": (0.0, 2.0, -3.0), "rotation": (30.0, 180.0, 0.0)},
+             "width": 3.0, "height": 2.0},
+        ),
+    },
+)
+
+
+def _builtin_rig(raw: Dict[str, Any]) -> LightRig:
+    # from_dict rewrites the dicts it is given, so hand it shallow copies
+    return LightRig.from_dict(dict(raw, lights=[dict(light) for light in raw["lights"]]))
+
+
+# Managers to flush at exit; weak so a closed panel's rig library can be freed
+_LIVE_MANAGERS: "weakref.WeakSet[LumenRigManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers():
+    """Write pending edits of every manager still alive"""
+    for manager in list(_LIVE_MANAGERS):
+        manager.flush()
+
+
+atexit.register(_flush_live_managers)
+
+
 class LumenRigManager:
     PRESET_DIR = Path(hou.expandString("$HOUDINI_USER_PREF_DIR")) / "lumen_rigs"
     
-    def __init__(self):
+    def __init__(self, load: bool = True):
         self._rigs: Dict[str, LightRig] = {}
         self._lock = threading.RLock()
-        self._ensure_dir()
-        self._load_rigs()
+        self._loaded = threading.Event()
+        self._sorted_names: Optional[Tuple[str, ...]] = None
+        # Rig name -> rig to write (None = deleted) since the last flush
+        self._pending: Dict[str, Optional[LightRig]] = {}
+        self._wal_count = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        _LIVE_MANAGERS.add(self)
+        if load:
+            self._load_from_disk()
+        else:
+            # Nothing to wait for until load_async() starts a load
+            self._loaded.set()
+        # Fill in builtins not on disk; rigs loaded later replace same-named ones
         self._load_builtin_presets()
     
+    def _load_from_disk(self):
+        try:
+            self._ensure_dir()
+            self._load_rigs()
+        finally:
+            self._loaded.set()
+        # Write edits that were queued while the load was running
+        self.flush()
+    
+    def load_async(self, on_loaded: Optional[Callable[[], None]] = None) -> threading.Thread:
+        """Load saved rigs on a background thread (on_loaded runs on that thread)"""
+        self._loaded.clear()
+        
+        def worker():
+            self._load_from_disk()
+            if on_loaded:
+                on_loaded()
+        
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded.is_set()
+    
     def _ensure_dir(self):
         try:
             self.PRESET_DIR.mkdir(parents=True, exist_ok=True)
         except:
             pass
     
+    @property
+    def _wal_file(self) -> Path:
+        return self.PRESET_DIR / "rigs.wal.jsonl"
+    
+    @property
+    def _cache_file(self) -> Path:
+        return self.PRESET_DIR / "rigs.cache.pkl"
+    
+    @staticmethod
+    def _cache_key(rig_file: Path) -> Tuple:
+        st = rig_file.stat()
+        return (SCHEMA_VERSION, st.st_mtime_ns, st.st_size)
+    
+    def _read_cache(self, key: Tuple) -> Optional[Dict[str, LightRig]]:
+        """Rigs pickled from the rigs.json identified by key, or None if stale/missing"""
+        try:
+            cached = pickle.loads(self._cache_file.read_bytes())
+            if cached.get("key") == key:
+                return cached["rigs"]
+        except Exception:
+            pass  # Missing, stale or unreadable cache: parse the JSON instead
+        return None
+    
+    def _write_cache(self, key: Tuple, rigs: Dict[str, LightRig]):
+        try:
+            payload = pickle.dumps({"key": key, "rigs": rigs}, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file = self._cache_file.with_suffix(".pkl.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self._cache_file)
+        except Exception as e:
+            print(f"[Lumen] Warning: Could not write rig cache: {e}")
+    
     def _load_rigs(self):
         rig_file = self.PRESET_DIR / "rigs.json"
-        if not rig_file.exists():
-            return
         
-        with self._lock:
+        # Read and decode outside the lock; only the merge needs it
+        loaded: Dict[str, LightRig] = {}
+        if rig_file.exists():
             try:
-                with open(rig_file, 'r') as f:
-                    data = json.load(f)
-                
-                rigs_data = data.get("_rigs", data)
-                for name, r_data in rigs_data.items():
-                    if name.startswith("_"):
-                        continue
-                    try:
-                        self._rigs[name] = LightRig.from_dict(r_data)
-                    except Exception as e:
-                        print(f"[Lumen] Warning: Could not load '{name}': {e}")
+                key = self._cache_key(rig_file)
+                cached = self._read_cache(key)
+                if cached is None:
+                    data = json.loads(rig_file.read_bytes())
+                    
+                    rigs_data = data.get("_rigs", data)
+                    for name, r_data in rigs_data.items():
+                        if name.startswith("_"):
+                            continue
+                        try:
+                            loaded[name] = LightRig.from_dict(r_data)
+                        except Exception as e:
+                            print(f"[Lumen] Warning: Could not load '{name}': {e}")
+                    self._write_cache(key, loaded)
+                else:
+                    loaded = cached
             except Exception as e:
                 print(f"[Lumen] Error loading rigs: {e}")
+        
+        records, wal_count = self._read_wal()
+        
+        with self._lock:
+            self._rigs.update(loaded)
+            for name, rig in records:
+                if rig is None:
+                    self._rigs.pop(name, None)
+                else:
+                    self._rigs[name] = rig
+            self._wal_count = wal_count
+            # Edits made while the load was running win over what was on disk
+            for name, rig in self._pending.items():
+                if rig is None:
+                    self._rigs.pop(name, None)
+                else:
+                    self._rigs[name] = rig
+            self._sorted_names = None
+    
+    def _read_wal(self) -> Tuple[List[Tuple[str, Optional[LightRig]]], int]:
+        """Decode edits logged since rigs.json was last rewritten (rig None = deleted)"""
+        wal_file = self._wal_file
+        if not wal_file.exists():
+            return [], 0
+        try:
+            lines = wal_file.read_bytes().splitlines()
+        except Exception as e:
+            print(f"[Lumen] Error reading edit log: {e}")
+            return [], 0
+        
+        records: List[Tuple[str, Optional[LightRig]]] = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+                name = record["name"]
+                if record["op"] == "delete":
+                    records.append((name, None))
+                else:
+                    records.append((name, LightRig.from_dict(record["rig"])))
+            except Exception as e:
+                # A torn final line from an interrupted append is expected
+                print(f"[Lumen] Warning: Skipping edit log entry: {e}")
+        return records, len(lines)
+    
+    def _append_wal(self, changes: Dict[str, Optional[LightRig]]):
+        """Append one log line per changed rig (upsert or delete)"""
+        with self._lock:
+            try:
+                payload = b"".join(
+                    json.dumps(
+                        {"op": "delete", "name": name} if rig is None
+                        else {"op": "upsert", "name": name, "rig": rig.to_dict()}
+                    ).encode("utf-8") + b"\n"
+                    for name, rig in changes.items()
+                )
+                with open(self._wal_file, 'ab', buffering=SAVE_BUFFER_SIZE) as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._wal_count += len(changes)
+            except Exception as e:
+                print(f"[Lumen] Error saving: {e}")
     
     def _save_rigs(self):
         rig_file = self.PRESET_DIR / "rigs.json"
         
         with self._lock:
             try:
-                import datetime
                 data = {
                     "_schema_version": SCHEMA_VERSION,
                     "_product": __product__,
-                    "_saved_at": datetime.datetime.now().isoformat(),
+                    "_saved_at": datetime.now().isoformat(),
                     "_rigs": {name: rig.to_dict() for name, rig in self._rigs.items()}
                 }
-                with open(rig_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Serialize in memory, write once, then swap in atomically
+                payload = json.dumps(data, indent=2).encode("utf-8")
+                tmp_file = rig_file.with_suffix(".json.tmp")
+                with open(tmp_file, 'wb', buffering=SAVE_BUFFER_SIZE) as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, rig_file)
+                self._write_cache(self._cache_key(rig_file), self._rigs)
+                # The full file now holds every logged edit
+                if self._wal_file.exists():
+                    self._wal_file.unlink()
+                self._wal_count = 0
             except Exception as e:
                 print(f"[Lumen] Error saving: {e}")
     
+    def _schedule_save(self, name: str, rig: Optional[LightRig]):
+        """Record a changed rig (None = deleted) and (re)start the debounced save"""
+        with self._lock:
+            self._pending[name] = rig
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+    
+    def flush(self):
+        """Write pending rig changes now (deferred until a running load finishes)"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            # Saving before the load finishes would drop saved rigs
+            if not self._pending or not self._loaded.is_set():
+                return
+            changes = self._pending
+            self._pending = {}
+            rig_file = self.PRESET_DIR / "rigs.json"
+            if (not rig_file.exists()
+                    or self._wal_count + len(changes) > WAL_COMPACT_THRESHOLD):
+                self._save_rigs()
+            else:
+                self._append_wal(changes)
+    
     def _load_builtin_presets(self):
-        for rig in self._get_builtin_presets():
-            if rig.name not in self._rigs:
-                self._rigs[rig.name] = rig
+        # Only build rigs for builtin names not already loaded from disk
+        with self._lock:
+            for raw in _BUILTIN_PRESETS_RAW:
+                if raw["name"] not in self._rigs:
+                    self._rigs[raw["name"]] = _builtin_rig(raw)
+            self._sorted_names = None
     
     def _get_builtin_presets(self) -> List[LightRig]:
-        return [
-            LightRig(
-                name="Three Point Basic",
-                lights=[
-                    LightSettings(name="key_light", light_type=LightType.RECT, role=LightRole.KEY,
-                                 intensity=1.5, temperature=5600,
-                                 transform=LightTransform(position=(3.0, 4.0, 3.0), rotation=(-45.0, 45.0, 0.0)),
-                                 width=2.0, height=2.0),
-                    LightSettings(name="fill_light", light_type=LightType.RECT, role=LightRole.FILL,
-                                 intensity=0.5, temperature=6500,
-                                 transform=LightTransform(position=(-3.0, 2.0, 2.0), rotation=(-30.0, -45.0, 0.0)),
-                                 width=3.0, height=3.0),
-                    LightSettings(name="rim_light", light_type=LightType.RECT, role=LightRole.RIM,
-                                 intensity=0.8, temperature=7500,
-                                 transform=LightTransform(position=(0.0, 3.0, -4.0), rotation=(45.0, 180.0, 0.0)),
-                                 width=1.5, height=1.5),
-                ],
-                notes="Classic three-point lighting"
-            ),
-            LightRig(
-                name="Studio HDRI",
-                lights=[
-                    LightSettings(name="dome_light", light_type=LightType.DOME, role=LightRole.AMBIENT,
-                                 intensity=1.0, texture_path="$HFS/houdini/pic/hdri/HDRIHaven_studio_small_03_1k.rat"),
-                    LightSettings(name="key_accent", light_type=LightType.RECT, role=LightRole.KEY,
-                                 intensity=0.8, temperature=5600,
-                                 transform=LightTransform(position=(2.0, 3.0, 2.0), rotation=(-40.0, 40.0, 0.0)),
-                                 width=1.5, height=1.5),
-                ],
-                notes="HDRI dome with accent key"
-            ),
-            LightRig(
-                name="Product Shot",
-                lights=[
-                    LightSettings(name="main_soft", light_type=LightType.RECT, role=LightRole.KEY,
-                                 intensity=2.0, temperature=5600,
-                                 transform=LightTransform(position=(0.0, 5.0, 3.0), rotation=(-60.0, 0.0, 0.0)),
-                                 width=4.0, height=4.0),
-                    LightSettings(name="side_fill_left", light_type=LightType.RECT, role=LightRole.FILL,
-                                 intensity=0.6,
-                                 transform=LightTransform(position=(-3.0, 2.0, 0.0), rotation=(0.0, -90.0, 0.0)),
-                                 width=2.0, height=3.0),
-                    LightSettings(name="side_fill_right", light_type=LightType.RECT, role=LightRole.FILL,
-                                 intensity=0.6,
-                                 transform=LightTransform(position=(3.0, 2.0, 0.0), rotation=(0.0, 90.0, 0.0)),
-                                 width=2.0, height=3.0),
-                    LightSettings(name="back_rim", light_type=LightType.RECT, role=LightRole.RIM,
-                                 intensity=1.2, temperature=7000,
-                                 transform=LightTransform(position=(0.0, 2.0, -3.0), rotation=(30.0, 180.0, 0.0)),
-                                 width=3.0, height=2.0),
-                ],
-                notes="Soft product photography lighting"
-            ),
-        ]
+        return [_builtin_rig(raw) for raw in _BUILTIN_PRESETS_RAW]
     
     @property
     def rigs(self) -> Dict[str, LightRig]:
         with self._lock:
             return dict(self._rigs)
     
+    def sorted_names(self) -> Tuple[str, ...]:
+        """Rig names in display order (cached until rigs are added/renamed/removed)"""
+        with self._lock:
+            names = self._sorted_names
+            if names is None:
+                names = self._sorted_names = tuple(sorted(self._rigs))
+            return names
+    
     def get_rig(self, name: str) -> Optional[LightRig]:
         with self._lock:
             return self._rigs.get(name)
     
     def create_rig(self, rig: LightRig) -> Tuple[bool, str]:
         with self._lock:
-            import datetime
-            rig.created_at = datetime.datetime.now().isoformat()
+            rig.created_at = datetime.now().isoformat()
             rig.modified_at = rig.created_at
             self._rigs[rig.name] = rig
-            self._save_rigs()
+            self._sorted_names = None
+            self._schedule_save(rig.name, rig)
         return True, f"Created: {rig.name}"
     
     def update_rig(self, name: str, rig: LightRig) -> Tuple[bool, str]:
         with self._lock:
             if name not in self._rigs:
                 return False, f"Not found: {name}"
-            import datetime
-            rig.modified_at = datetime.datetime.now().isoformat()
+            rig.modified_at = datetime.now().isoformat()
             rig.created_at = self._rigs[name].created_at
             if name != rig.name:
                 del self._rigs[name]
+                self._sorted_names = None
+                self._schedule_save(name, None)
             self._rigs[rig.name] = rig
-            self._save_rigs()
+            self._schedule_save(rig.name, rig)
         return True, f"Updated: {rig.name}"
     
+    def touch_rig(self, name: str, rig: LightRig) -> Tuple[bool, str]:
+        """
+        Mark a rig edited in place as modified and queue it for saving.
+
+        If name no longer maps to rig (e.g. the background load replaced the
+        builtin the panel was editing), rig is stored through update_rig().
+        """
+        with self._lock:
+            if self._rigs.get(name) is not rig:
+                return self.update_rig(name, rig)
+            rig.modified_at = datetime.now().isoformat()
+            self._schedule_save(name, rig)
+        return True, f"Updated: {name}"
+    
     def delete_rig(self, name: str) -> Tuple[bool, str]:
         with self._lock:
             if name not in self._rigs:
                 return False, f"Not found: {name}"
             del self._rigs[name]
-            self._save_rigs()
+            self._sorted_names = None
+            self._schedule_save(name, None)
         return True, f"Deleted: {name}"
     
     def build_rig_in_solaris(self, rig_name: str, parent_path: str = "/stage", lights_root: str = "/lights") -> Tuple[bool, str, List[hou.Node]]:
@@ -514,41 +827,57 @@ class LumenRigManager:
         
         created_nodes: List[hou.Node] = []
         
+        # One undo entry and no cooking while the network is assembled
+        prev_update_mode = hou.updateModeSetting()
+        hou.setUpdateMode(hou.updateMode.Manual)
         try:
-            for light in rig.lights:
-                if not light.enabled:
-                    continue
+            with hou.undos.group(f"Build Lumen Rig: {rig_name}"):
+                for light in rig.lights:
+                    if not light.enabled:
+                        continue
+                    
+                    prim_path = f"{lights_root}/{light.name}"
+                    node = SolarisLightFactory.create_light(parent, light, prim_path, defer_layout=True)
+                    if node:
+                        created_nodes.append(node)
                 
-                prim_path = f"{lights_root}/{light.name}"
-                node = SolarisLightFactory.create_light(parent, light, prim_path)
-                if node:
-                    created_nodes.append(node)
-            
-            if len(created_nodes) > 1:
-                merge = parent.createNode("merge", f"merge_{rig_name}")
-                for i, node in enumerate(created_nodes):
-                    merge.setInput(i, node)
-                merge.moveToGoodPosition()
-                created_nodes.append(merge)
-            
-            if created_nodes:
-                box = parent.createNetworkBox(rig_name)
-                box.setComment(f"Lumen Rig: {rig_name}\n{rig.notes}")
-                for node in created_nodes:
-                    box.addNode(node)
-                box.fitAroundContents()
+                # Single layout pass once every light exists
+                if created_nodes:
+                    parent.layoutChildren(items=created_nodes)
+                
+                if len(created_nodes) > 1:
+                    merge = parent.createNode("merge", f"merge_{rig_name}")
+                    for i, node in enumerate(created_nodes):
+                        merge.setInput(i, node)
+                    merge.moveToGoodPosition()
+                    created_nodes.append(merge)
+                
+                # A lone light needs neither a merge nor a box around it
+                if len(created_nodes) > 1:
+                    box = parent.createNetworkBox(rig_name)
+                    box.setComment(f"Lumen Rig: {rig_name}\n{rig.notes}")
+                    for node in created_nodes:
+                        box.addNode(node)
+                    box.fitAroundContents()
             
             return True, f"Built {len(rig.lights)} lights", created_nodes
             
         except Exception as e:
             traceback.print_exc()
             return False, f"Error: {e}", created_nodes
+        finally:
+            hou.setUpdateMode(prev_update_mode)
 
 
 # =============================================================================
 # QT PANEL
 # =============================================================================
 
+# Light list label pieces, indexed by enabled flag / keyed by type
+_ENABLED_MARK = ("✗ ", "✓ ")
+_TYPE_SUFFIX = {lt: f" ({lt.value})" for lt in LightType}
+
+
 class LightEditorWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -561,12 +890,16 @@ class LightEditorWidget(QtWidgets.QWidget):
         layout.addRow("Name:", self.name_edit)
         
         self.type_combo = QtWidgets.QComboBox()
+        self._type_index: Dict[LightType, int] = {}
         for lt in LightType:
+            self._type_index[lt] = self.type_combo.count()
             self.type_combo.addItem(lt.value.title(), lt)
         layout.addRow("Type:", self.type_combo)
         
         self.role_combo = QtWidgets.QComboBox()
+        self._role_index: Dict[LightRole, int] = {}
         for role in LightRole:
+            self._role_index[role] = self.role_combo.count()
             self.role_combo.addItem(role.value.title(), role)
         layout.addRow("Role:", self.role_combo)
         
@@ -659,53 +992,79 @@ class LightEditorWidget(QtWidgets.QWidget):
         self.enabled = QtWidgets.QCheckBox("Enabled")
         self.enabled.setChecked(True)
         layout.addRow("", self.enabled)
+        
+        # Bound getters read by get_settings: (LightSettings field, getter)
+        self._getters = (
+            ("light_type", self.type_combo.currentData),
+            ("role", self.role_combo.currentData),
+            ("intensity", self.intensity.value),
+            ("exposure", self.exposure.value),
+            ("width", self.width.value),
+            ("height", self.height.value),
+            ("radius", self.radius.value),
+            ("shadow_enable", self.shadow.isChecked),
+            ("enabled", self.enabled.isChecked),
+        )
+        self._color_getters = (self.color_r.value, self.color_g.value, self.color_b.value)
+        self._pos_getters = (self.pos_x.value, self.pos_y.value, self.pos_z.value)
+        self._rot_getters = (self.rot_x.value, self.rot_y.value, self.rot_z.value)
+        
+        # Widgets written by set_settings, silenced while it loads a light
+        self._editable_widgets = (
+            self.name_edit, self.type_combo, self.role_combo,
+            self.intensity, self.exposure, self.use_temp, self.temp,
+            self.color_r, self.color_g, self.color_b,
+            self.pos_x, self.pos_y, self.pos_z,
+            self.rot_x, self.rot_y, self.rot_z,
+            self.width, self.height, self.radius,
+            self.shadow, self.enabled,
+        )
     
     def get_settings(self) -> LightSettings:
-        return LightSettings(
-            name=self.name_edit.text() or "light",
-            light_type=self.type_combo.currentData(),
-            role=self.role_combo.currentData(),
-            intensity=self.intensity.value(),
-            exposure=self.exposure.value(),
-            color=(self.color_r.value(), self.color_g.value(), self.color_b.value()),
-            temperature=self.temp.value() if self.use_temp.isChecked() else None,
-            transform=LightTransform(
-                position=(self.pos_x.value(), self.pos_y.value(), self.pos_z.value()),
-                rotation=(self.rot_x.value(), self.rot_y.value(), self.rot_z.value())
-            ),
-            width=self.width.value(), height=self.height.value(), radius=self.radius.value(),
-            shadow_enable=self.shadow.isChecked(), enabled=self.enabled.isChecked()
+        kw = {name: get() for name, get in self._getters}
+        kw["name"] = self.name_edit.text() or "light"
+        kw["color"] = tuple([get() for get in self._color_getters])
+        kw["temperature"] = self.temp.value() if self.use_temp.isChecked() else None
+        kw["transform"] = LightTransform(
+            position=tuple([get() for get in self._pos_getters]),
+            rotation=tuple([get() for get in self._rot_getters])
         )
+        return LightSettings(**kw)
     
     def set_settings(self, s: LightSettings):
-        self.name_edit.setText(s.name)
-        for i in range(self.type_combo.count()):
-            if self.type_combo.itemData(i) == s.light_type:
-                self.type_combo.setCurrentIndex(i)
-                break
-        for i in range(self.role_combo.count()):
-            if self.role_combo.itemData(i) == s.role:
-                self.role_combo.setCurrentIndex(i)
-                break
-        self.intensity.setValue(s.intensity)
-        self.exposure.setValue(s.exposure)
-        self.use_temp.setChecked(s.temperature is not None)
-        if s.temperature:
-            self.temp.setValue(int(s.temperature))
-        self.color_r.setValue(s.color[0])
-        self.color_g.setValue(s.color[1])
-        self.color_b.setValue(s.color[2])
-        self.pos_x.setValue(s.transform.position[0])
-        self.pos_y.setValue(s.transform.position[1])
-        self.pos_z.setValue(s.transform.position[2])
-        self.rot_x.setValue(s.transform.rotation[0])
-        self.rot_y.setValue(s.transform.rotation[1])
-        self.rot_z.setValue(s.transform.rotation[2])
-        self.width.setValue(s.width)
-        self.height.setValue(s.height)
-        self.radius.setValue(s.radius)
-        self.shadow.setChecked(s.shadow_enable)
-        self.enabled.setChecked(s.enabled)
+        was_blocked = [w.blockSignals(True) for w in self._editable_widgets]
+        try:
+            self.name_edit.setText(s.name)
+            type_index = self._type_index.get(s.light_type)
+            if type_index is not None:
+                self.type_combo.setCurrentIndex(type_index)
+            role_index = self._role_index.get(s.role)
+            if role_index is not None:
+                self.role_combo.setCurrentIndex(role_index)
+            self.intensity.setValue(s.intensity)
+            self.exposure.setValue(s.exposure)
+            self.use_temp.setChecked(s.temperature is not None)
+            if s.temperature:
+                self.temp.setValue(int(s.temperature))
+            self.color_r.setValue(s.color[0])
+            self.color_g.setValue(s.color[1])
+            self.color_b.setValue(s.color[2])
+            self.pos_x.setValue(s.transform.position[0])
+            self.pos_y.setValue(s.transform.position[1])
+            self.pos_z.setValue(s.transform.position[2])
+            self.rot_x.setValue(s.transform.rotation[0])
+            self.rot_y.setValue(s.transform.rotation[1])
+            self.rot_z.setValue(s.transform.rotation[2])
+            self.width.setValue(s.width)
+            self.height.setValue(s.height)
+            self.radius.setValue(s.radius)
+            self.shadow.setChecked(s.shadow_enable)
+            self.enabled.setChecked(s.enabled)
+            # use_temp.toggled normally drives this; it was blocked above
+            self.temp.setEnabled(s.temperature is not None)
+        finally:
+            for widget, blocked in zip(self._editable_widgets, was_blocked):
+                widget.blockSignals(blocked)
     
     def clear(self):
         self.name_edit.clear()
@@ -732,11 +1091,16 @@ class LightEditorWidget(QtWidgets.QWidget):
 
 
 class LumenPanel(QtWidgets.QWidget):
+    rigs_loaded = QtCore.Signal()
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.manager = LumenRigManager()
+        # Saved rigs load in the background so the panel opens immediately
+        self.manager = LumenRigManager(load=False)
         self._current_rig: Optional[LightRig] = None
         self._init_ui()
+        self.rigs_loaded.connect(self._refresh_rig_list)
+        self.manager.load_async(self.rigs_loaded.emit)
     
     def _init_ui(self):
         self.setWindowTitle(f"{__title__} - Lighting Rig Manager")
@@ -860,16 +1224,26 @@ class LumenPanel(QtWidgets.QWidget):
         self._refresh_rig_list()
     
     def _refresh_rig_list(self):
-        self.rig_list.clear()
-        for name in sorted(self.manager.rigs.keys()):
-            self.rig_list.addItem(name)
+        self.rig_list.setUpdatesEnabled(False)
+        try:
+            self.rig_list.clear()
+            self.rig_list.addItems(self.manager.sorted_names())
+        finally:
+            self.rig_list.setUpdatesEnabled(True)
     
     def _refresh_light_list(self):
-        self.light_list.clear()
+        labels = []
         if self._current_rig:
-            for light in self._current_rig.lights:
-                icon = "✓" if light.enabled else "✗"
-                self.light_list.addItem(f"{icon} {light.name} ({light.light_type.value})")
+            labels = [
+                _ENABLED_MARK[bool(light.enabled)] + light.name + _TYPE_SUFFIX[light.light_type]
+                for light in self._current_rig.lights
+            ]
+        self.light_list.setUpdatesEnabled(False)
+        try:
+            self.light_list.clear()
+            self.light_list.addItems(labels)
+        finally:
+            self.light_list.setUpdatesEnabled(True)
     
     def _on_rig_selected(self, current, previous):
         if current:
@@ -910,9 +1284,12 @@ class LumenPanel(QtWidgets.QWidget):
         try:
             settings = self.light_editor.get_settings()
             self._current_rig.lights.append(settings)
-            self.manager.update_rig(self._current_rig.name, self._current_rig)
+            success, msg = self.manager.touch_rig(self._current_rig.name, self._current_rig)
             self._refresh_light_list()
-            self._set_status(f"Added: {settings.name}", "success")
+            if success:
+                self._set_status(f"Added: {settings.name}", "success")
+            else:
+                self._set_status(msg, "error")
         except ValueError as e:
             self._set_status(str(e), "error")
     
@@ -925,9 +1302,12 @@ class LumenPanel(QtWidgets.QWidget):
         idx = self.light_list.row(current)
         if 0 <= idx < len(self._current_rig.lights):
             removed = self._current_rig.lights.pop(idx)
-            self.manager.update_rig(self._current_rig.name, self._current_rig)
+            success, msg = self.manager.touch_rig(self._current_rig.name, self._current_rig)
             self._refresh_light_list()
-            self._set_status(f"Removed: {removed.name}", "success")
+            if success:
+                self._set_status(f"Removed: {removed.name}", "success")
+            else:
+                self._set_status(msg, "error")
     
     def _update_light(self):
         if not self._current_rig:
@@ -940,9 +1320,12 @@ class LumenPanel(QtWidgets.QWidget):
             try:
                 settings = self.light_editor.get_settings()
                 self._current_rig.lights[idx] = settings
-                self.manager.update_rig(self._current_rig.name, self._current_rig)
+                success, msg = self.manager.touch_rig(self._current_rig.name, self._current_rig)
                 self._refresh_light_list()
-                self._set_status(f"Updated: {settings.name}", "success")
+                if success:
+                    self._set_status(f"Updated: {settings.name}", "success")
+                else:
+                    self._set_status(msg, "error")
             except ValueError as e:
                 self._set_status(str(e), "error")
     
@@ -955,6 +1338,10 @@ class LumenPanel(QtWidgets.QWidget):
         )
         self._set_status(msg, "success" if success else "error")
     
+    def closeEvent(self, event):
+        self.manager.flush()
+        super().closeEvent(event)
+    
     def _set_status(self, message: str, status_type: str = "info"):
         colors = {"success": "#7D8B69", "error": "#8B4513", "info": "#CC7722"}
         self.status_label.setStyleSheet(f"color: {colors.get(status_type, '#888')};")
@@ -13,14 +13,14 @@
 ║                                                                               ║
 ╚═══════════════════════════════════════════════════════════════════════════════╝
 
-Prism v2.1.0 | Houdini 21+ | Python 3.9+
+Prism v2.1.0 | Houdini 21+ | Python 3.10+
 
 Unified GOBO management across Karma, Arnold, RenderMan, Redshift, and V-Ray.
 Automatic transform order compensation ensures pixel-perfect results everywhere.
 
 FEATURES:
 • Renderer-aware transform matrices (SRT vs TRS order)
-• Thread-safe adapter factory with double-checked locking
+• Prebuilt, stateless renderer adapters
 • USD API direct access for H21 stability
 • Schema versioning for team collaboration
 • Effect chain with configurable application order
@@ -42,18 +42,59 @@ __license__ = "MIT"
 __product__ = "Prism - Cross-Renderer GOBO Manager"
 
 import hou
+import os
 import math
 import json
+import atexit
+import weakref
 import threading
 import traceback
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Callable, Mapping
+from dataclasses import dataclass, field, fields, MISSING
+from datetime import datetime
 from enum import Enum
 from abc import ABC, abstractmethod
 from PySide6 import QtWidgets, QtCore, QtGui
 
+# orjson is optional; it serializes large libraries several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SCHEMA_VERSION = "2.1.0"
+SAVE_DEBOUNCE_SECONDS = 0.25  # Save the library at most this often during bursts of edits
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+
+
+def _write_file_bytes(path: Path, payload: bytes) -> None:
+    """Write payload straight to the file descriptor and sync it to disk"""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 # =============================================================================
@@ -105,7 +146,67 @@ RENDERER_TRANSFORM_ORDERS = {
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _sincos(rotation: float) -> Tuple[float, float]:
+    """(cos, sin) of a rotation in degrees; animated GOBOs revisit the same angles"""
+    r = math.radians(rotation)
+    return math.cos(r), math.sin(r)
+
+
+@lru_cache(maxsize=1024)
+def _build_matrix(su: float, sv: float, rotation: float, ou: float, ov: float,
+                  pu: float, pv: float, order: TransformOrder) -> Tuple[Tuple[float, ...], ...]:
+    """3x3 GOBO UV matrix; renderers sharing a TransformOrder reuse one result"""
+    cos_r, sin_r = _sincos(rotation)
+    
+    # Rotation about the pivot (P_pos * R * P_neg) has this translation column
+    a = pu - cos_r * pu + sin_r * pv
+    b = pv - sin_r * pu - cos_r * pv
+    
+    # Each order is that product expanded by hand; the bottom row is always 0 0 1
+    if order == TransformOrder.TRS:      # S * R_pivot * T
+        return ((su * cos_r, -su * sin_r, su * (cos_r * ou - sin_r * ov + a)),
+                (sv * sin_r, sv * cos_r, sv * (sin_r * ou + cos_r * ov + b)),
+                (0.0, 0.0, 1.0))
+    elif order == TransformOrder.RST:    # T * S * R_pivot
+        return ((su * cos_r, -su * sin_r, su * a + ou),
+                (sv * sin_r, sv * cos_r, sv * b + ov),
+                (0.0, 0.0, 1.0))
+    elif order == TransformOrder.RTS:    # S * T * R_pivot
+        return ((su * cos_r, -su * sin_r, su * (a + ou)),
+                (sv * sin_r, sv * cos_r, sv * (b + ov)),
+                (0.0, 0.0, 1.0))
+    else:                                # SRT: T * R_pivot * S
+        return ((cos_r * su, -sin_r * sv, a + ou),
+                (sin_r * su, cos_r * sv, b + ov),
+                (0.0, 0.0, 1.0))
+
+
+_FIELD_SPECS: Dict[type, Tuple[Tuple[str, Any, Any], ...]] = {}
+
+
+def _construct_unchecked(cls, data: Dict[str, Any]):
+    """Build dataclass cls from data (plus field defaults) without __post_init__"""
+    specs = _FIELD_SPECS.get(cls)
+    if specs is None:
+        specs = _FIELD_SPECS[cls] = tuple((f.name, f.default, f.default_factory) for f in fields(cls))
+    if len(data) > len(specs) or not data.keys() <= {name for name, _, _ in specs}:
+        return cls(**data)  # Let __init__ report unknown fields
+    obj = object.__new__(cls)
+    for name, default, factory in specs:
+        if name in data:
+            value = data[name]
+        elif default is not MISSING:
+            value = default
+        elif factory is not MISSING:
+            value = factory()
+        else:
+            return cls(**data)  # Let __init__ report the missing field
+        object.__setattr__(obj, name, value)  # Also works on the frozen PrismTransform
+    return obj
+
+
+@dataclass(frozen=True, slots=True)
 class PrismTransform:
     """GOBO UV transform with configurable application order"""
     scale_u: float = 1.0
@@ -117,52 +218,32 @@ class PrismTransform:
     pivot_v: float = 0.5
     
     def __post_init__(self):
+        self.validate()
+    
+    def validate(self):
         if self.scale_u <= 0 or self.scale_v <= 0:
             raise ValueError("Scale must be positive")
         if not -360 <= self.rotation <= 360:
             raise ValueError("Rotation must be between -360 and 360 degrees")
     
-    def to_matrix_3x3(self, order: TransformOrder = TransformOrder.SRT) -> List[List[float]]:
-        """Build 3x3 transformation matrix with specified order"""
-        cos_r = math.cos(math.radians(self.rotation))
-        sin_r = math.sin(math.radians(self.rotation))
-        
-        S = [[self.scale_u, 0.0, 0.0], [0.0, self.scale_v, 0.0], [0.0, 0.0, 1.0]]
-        R = [[cos_r, -sin_r, 0.0], [sin_r, cos_r, 0.0], [0.0, 0.0, 1.0]]
-        T = [[1.0, 0.0, self.offset_u], [0.0, 1.0, self.offset_v], [0.0, 0.0, 1.0]]
-        P_neg = [[1.0, 0.0, -self.pivot_u], [0.0, 1.0, -self.pivot_v], [0.0, 0.0, 1.0]]
-        P_pos = [[1.0, 0.0, self.pivot_u], [0.0, 1.0, self.pivot_v], [0.0, 0.0, 1.0]]
-        
-        R_pivot = self._mat_mult(P_pos, self._mat_mult(R, P_neg))
-        
-        if order == TransformOrder.SRT:
-            return self._mat_mult(T, self._mat_mult(R_pivot, S))
-        elif order == TransformOrder.TRS:
-            return self._mat_mult(S, self._mat_mult(R_pivot, T))
-        elif order == TransformOrder.RST:
-            return self._mat_mult(T, self._mat_mult(S, R_pivot))
-        elif order == TransformOrder.RTS:
-            return self._mat_mult(S, self._mat_mult(T, R_pivot))
-        else:
-            return self._mat_mult(T, self._mat_mult(R_pivot, S))
-    
-    def _mat_mult(self, A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
-        result = [[0.0] * 3 for _ in range(3)]
-        for i in range(3):
-            for j in range(3):
-                for k in range(3):
-                    result[i][j] += A[i][k] * B[k][j]
-        return result
+    def to_matrix_3x3(self, order: TransformOrder = TransformOrder.SRT) -> Tuple[Tuple[float, ...], ...]:
+        """Build 3x3 transformation matrix with specified order (shared, read-only)"""
+        return _build_matrix(self.scale_u, self.scale_v, self.rotation,
+                             self.offset_u, self.offset_v, self.pivot_u, self.pivot_v, order)
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "scale_u": self.scale_u, "scale_v": self.scale_v, "rotation": self.rotation,
+            "offset_u": self.offset_u, "offset_v": self.offset_v,
+            "pivot_u": self.pivot_u, "pivot_v": self.pivot_v
+        }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'PrismTransform':
-        return cls(**data)
+    def from_dict(cls, data: Dict, validate: bool = True) -> 'PrismTransform':
+        return cls(**data) if validate else _construct_unchecked(cls, data)
 
 
-@dataclass
+@dataclass(slots=True)
 class PrismEffect:
     """Post-processing effects for GOBO texture"""
     blur: float = 0.0
@@ -176,6 +257,9 @@ class PrismEffect:
     effect_order: List[str] = field(default_factory=lambda: ["blur", "sharpen", "dilate", "erode", "contrast", "brightness", "gamma", "invert"])
     
     def __post_init__(self):
+        self.validate()
+    
+    def validate(self):
         if not 0 <= self.blur <= 100:
             raise ValueError("Blur must be 0-100")
         if not 0.1 <= self.contrast <= 10:
@@ -184,18 +268,22 @@ class PrismEffect:
             raise ValueError("Brightness must be -1 to 1")
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "blur": self.blur, "sharpen": self.sharpen, "contrast": self.contrast,
+            "brightness": self.brightness, "gamma": self.gamma, "invert": self.invert,
+            "dilate": self.dilate, "erode": self.erode, "effect_order": list(self.effect_order)
+        }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'PrismEffect':
+    def from_dict(cls, data: Dict, validate: bool = True) -> 'PrismEffect':
         effect_order = data.pop("effect_order", None)
-        effect = cls(**data)
+        effect = cls(**data) if validate else _construct_unchecked(cls, data)
         if effect_order:
             effect.effect_order = effect_order
         return effect
 
 
-@dataclass
+@dataclass(slots=True)
 class PrismGOBO:
     """Complete cross-renderer GOBO configuration"""
     name: str
@@ -219,6 +307,9 @@ class PrismGOBO:
     modified_at: str = ""
     
     def __post_init__(self):
+        self.validate()
+    
+    def validate(self):
         if not self.name:
             raise ValueError("GOBO name cannot be empty")
         if not self.source_path:
@@ -248,26 +339,109 @@ class PrismGOBO:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'PrismGOBO':
+    def from_dict(cls, data: Dict, validate: bool = True) -> 'PrismGOBO':
+        """Build from a to_dict() payload; validate=False trusts the data (our own saves)"""
         data.pop("_schema_version", None)
         data.pop("_product", None)
         
         if "transform" in data:
-            data["transform"] = PrismTransform.from_dict(data["transform"])
+            data["transform"] = PrismTransform.from_dict(data["transform"], validate)
         if "effects" in data:
-            data["effects"] = PrismEffect.from_dict(data["effects"])
+            data["effects"] = PrismEffect.from_dict(data["effects"], validate)
         if "blend_mode" in data:
             data["blend_mode"] = BlendMode(data["blend_mode"])
         if "filter_mode" in data:
             data["filter_mode"] = FilterMode(data["filter_mode"])
         
-        return cls(**data)
+        return cls(**data) if validate else _construct_unchecked(cls, data)
 
 
 # =============================================================================
-# RENDERER ADAPTERS (Thread-Safe Factory)
+# RENDERER ADAPTERS
 # =============================================================================
 
+def _texture_reference(gobo: PrismGOBO) -> str:
+    return f"op:{gobo.source_path}" if gobo.source_type == "cop" else gobo.source_path
+
+
+# (USD attribute, Sdf.ValueTypeNames member, gobo -> value)
+AttributeSchedule = Tuple[Tuple[str, str, Callable[[PrismGOBO], Any]], ...]
+
+_scale_u = attrgetter("transform.scale_u")
+_scale_v = attrgetter("transform.scale_v")
+_rotation = attrgetter("transform.rotation")
+_offset_u = attrgetter("transform.offset_u")
+_offset_v = attrgetter("transform.offset_v")
+_blur = attrgetter("effects.blur")
+_intensity = attrgetter("intensity")
+
+# Per renderer: (texture attribute, USD light types, attribute schedule)
+_RENDERER_SPECS: Dict[Renderer, Tuple[str, Tuple[str, ...], AttributeSchedule]] = {
+    Renderer.KARMA: (
+        "inputs:texture:file",
+        ("RectLight", "DiskLight", "DistantLight", "SphereLight", "CylinderLight"),
+        (
+            ("inputs:texture:file", "String", _texture_reference),
+            ("inputs:texture:scaleS", "Float", _scale_u),
+            ("inputs:texture:scaleT", "Float", _scale_v),
+            ("inputs:texture:rotate", "Float", _rotation),
+            ("inputs:texture:offsetS", "Float", _offset_u),
+            ("inputs:texture:offsetT", "Float", _offset_v),
+            ("karma:light:textureSoftness", "Float", lambda gobo: gobo.effects.blur / 100.0),
+            ("karma:light:textureIntensity", "Float", _intensity),
+        ),
+    ),
+    Renderer.ARNOLD: (
+        "arnold:gobo:filename",
+        ("RectLight", "DiskLight", "DistantLight", "SphereLight"),
+        (
+            ("arnold:gobo:filename", "String", _texture_reference),
+            ("arnold:gobo:scale_s", "Float", _scale_u),
+            ("arnold:gobo:scale_t", "Float", _scale_v),
+            ("arnold:gobo:rotate", "Float", _rotation),
+            ("arnold:gobo:offset_s", "Float", _offset_u),
+            ("arnold:gobo:offset_t", "Float", _offset_v),
+            ("arnold:gobo:intensity", "Float", _intensity),
+            ("arnold:gobo:blur", "Float", _blur),
+        ),
+    ),
+    Renderer.RENDERMAN: (
+        "ri:light:lightBlockerMap",
+        ("RectLight", "DiskLight", "DistantLight", "SphereLight", "CylinderLight"),
+        (
+            ("ri:light:lightBlockerMap", "String", _texture_reference),
+            ("ri:light:blockerWidth", "Float", _scale_u),
+            ("ri:light:blockerHeight", "Float", _scale_v),
+            ("ri:light:blockerRot", "Float", _rotation),
+        ),
+    ),
+    Renderer.REDSHIFT: (
+        "redshift:light:gobo",
+        ("RectLight", "DiskLight", "DomeLight", "SphereLight"),
+        (
+            ("redshift:light:gobo", "String", _texture_reference),
+            ("redshift:light:gobo_scale_x", "Float", _scale_u),
+            ("redshift:light:gobo_scale_y", "Float", _scale_v),
+            ("redshift:light:gobo_rotation", "Float", _rotation),
+            ("redshift:light:gobo_offset_x", "Float", _offset_u),
+            ("redshift:light:gobo_offset_y", "Float", _offset_v),
+            ("redshift:light:gobo_intensity", "Float", _intensity),
+            ("redshift:light:gobo_blur", "Float", _blur),
+        ),
+    ),
+    Renderer.VRAY: (
+        "vray:light:texmap",
+        ("RectLight", "DiskLight", "DomeLight", "SphereLight"),
+        (
+            ("vray:light:texmap", "String", _texture_reference),
+            ("vray:light:texmap_scale_u", "Float", _scale_u),
+            ("vray:light:texmap_scale_v", "Float", _scale_v),
+            ("vray:light:texmap_rotate", "Float", _rotation),
+        ),
+    ),
+}
+
+
 class RendererAdapterBase(ABC):
     @property
     @abstractmethod
@@ -284,277 +458,239 @@ class RendererAdapterBase(ABC):
     def usd_light_types(self) -> List[str]:
         pass
     
+    @property
     @abstractmethod
-    def get_gobo_attributes(self, gobo: PrismGOBO) -> Dict[str, Any]:
+    def attribute_schedule(self) -> AttributeSchedule:
         pass
     
     @abstractmethod
     def get_texture_attribute_name(self) -> str:
         pass
     
+    def get_gobo_attributes(self, gobo: PrismGOBO) -> Dict[str, Any]:
+        return {name: getter(gobo) for name, _sdf_type, getter in self.attribute_schedule}
+    
     def format_texture_reference(self, source_path: str, source_type: str) -> str:
         return f"op:{source_path}" if source_type == "cop" else source_path
 
 
-class KarmaRendererAdapter(RendererAdapterBase):
-    @property
-    def renderer(self) -> Renderer:
-        return Renderer.KARMA
-    
-    @property
-    def transform_order(self) -> TransformOrder:
-        return TransformOrder.SRT
-    
-    @property
-    def usd_light_types(self) -> List[str]:
-        return ["RectLight", "DiskLight", "DistantLight", "SphereLight", "CylinderLight"]
+class GenericRendererAdapter(RendererAdapterBase):
+    """Adapter driven by the renderer's entry in _RENDERER_SPECS"""
     
-    def get_texture_attribute_name(self) -> str:
-        return "inputs:texture:file"
+    def __init__(self, renderer: Renderer):
+        self._renderer = renderer
+        self._transform_order = RENDERER_TRANSFORM_ORDERS[renderer]
+        self._texture_attribute, light_types, self._schedule = _RENDERER_SPECS[renderer]
+        self._usd_light_types = list(light_types)
     
-    def get_gobo_attributes(self, gobo: PrismGOBO) -> Dict[str, Any]:
-        return {
-            self.get_texture_attribute_name(): self.format_texture_reference(gobo.source_path, gobo.source_type),
-            "inputs:texture:scaleS": gobo.transform.scale_u,
-            "inputs:texture:scaleT": gobo.transform.scale_v,
-            "inputs:texture:rotate": gobo.transform.rotation,
-            "inputs:texture:offsetS": gobo.transform.offset_u,
-            "inputs:texture:offsetT": gobo.transform.offset_v,
-            "karma:light:textureSoftness": gobo.effects.blur / 100.0,
-            "karma:light:textureIntensity": gobo.intensity,
-        }
-
-
-class ArnoldRendererAdapter(RendererAdapterBase):
     @property
     def renderer(self) -> Renderer:
-        return Renderer.ARNOLD
+        return self._renderer
     
     @property
     def transform_order(self) -> TransformOrder:
-        return TransformOrder.SRT
+        return self._transform_order
     
     @property
     def usd_light_types(self) -> List[str]:
-        return ["RectLight", "DiskLight", "DistantLight", "SphereLight"]
-    
-    def get_texture_attribute_name(self) -> str:
-        return "arnold:gobo:filename"
+        return self._usd_light_types
     
-    def get_gobo_attributes(self, gobo: PrismGOBO) -> Dict[str, Any]:
-        return {
-            self.get_texture_attribute_name(): self.format_texture_reference(gobo.source_path, gobo.source_type),
-            "arnold:gobo:scale_s": gobo.transform.scale_u,
-            "arnold:gobo:scale_t": gobo.transform.scale_v,
-            "arnold:gobo:rotate": gobo.transform.rotation,
-            "arnold:gobo:offset_s": gobo.transform.offset_u,
-            "arnold:gobo:offset_t": gobo.transform.offset_v,
-            "arnold:gobo:intensity": gobo.intensity,
-            "arnold:gobo:blur": gobo.effects.blur,
-        }
-
-
-class RenderManRendererAdapter(RendererAdapterBase):
     @property
-    def renderer(self) -> Renderer:
-        return Renderer.RENDERMAN
-    
-    @property
-    def transform_order(self) -> TransformOrder:
-        return TransformOrder.SRT
-    
-    @property
-    def usd_light_types(self) -> List[str]:
-        return ["RectLight", "DiskLight", "DistantLight", "SphereLight", "CylinderLight"]
+    def attribute_schedule(self) -> AttributeSchedule:
+        return self._schedule
     
     def get_texture_attribute_name(self) -> str:
-        return "ri:light:lightBlockerMap"
-    
-    def get_gobo_attributes(self, gobo: PrismGOBO) -> Dict[str, Any]:
-        return {
-            self.get_texture_attribute_name(): self.format_texture_reference(gobo.source_path, gobo.source_type),
-            "ri:light:blockerWidth": gobo.transform.scale_u,
-            "ri:light:blockerHeight": gobo.transform.scale_v,
-            "ri:light:blockerRot": gobo.transform.rotation,
-        }
+        return self._texture_attribute
 
 
-class RedshiftRendererAdapter(RendererAdapterBase):
-    @property
-    def renderer(self) -> Renderer:
-        return Renderer.REDSHIFT
-    
-    @property
-    def transform_order(self) -> TransformOrder:
-        return TransformOrder.TRS  # Redshift uses TRS!
-    
-    @property
-    def usd_light_types(self) -> List[str]:
-        return ["RectLight", "DiskLight", "DomeLight", "SphereLight"]
-    
-    def get_texture_attribute_name(self) -> str:
-        return "redshift:light:gobo"
-    
-    def get_gobo_attributes(self, gobo: PrismGOBO) -> Dict[str, Any]:
-        return {
-            self.get_texture_attribute_name(): self.format_texture_reference(gobo.source_path, gobo.source_type),
-            "redshift:light:gobo_scale_x": gobo.transform.scale_u,
-            "redshift:light:gobo_scale_y": gobo.transform.scale_v,
-            "redshift:light:gobo_rotation": gobo.transform.rotation,
-            "redshift:light:gobo_offset_x": gobo.transform.offset_u,
-            "redshift:light:gobo_offset_y": gobo.transform.offset_v,
-            "redshift:light:gobo_intensity": gobo.intensity,
-            "redshift:light:gobo_blur": gobo.effects.blur,
-        }
+# Adapters are stateless, so one per renderer is built at import
+_ADAPTERS: Dict[Renderer, RendererAdapterBase] = {r: GenericRendererAdapter(r) for r in Renderer}
 
 
-class VRayRendererAdapter(RendererAdapterBase):
-    @property
-    def renderer(self) -> Renderer:
-        return Renderer.VRAY
-    
-    @property
-    def transform_order(self) -> TransformOrder:
-        return TransformOrder.SRT
-    
-    @property
-    def usd_light_types(self) -> List[str]:
-        return ["RectLight", "DiskLight", "DomeLight", "SphereLight"]
-    
-    def get_texture_attribute_name(self) -> str:
-        return "vray:light:texmap"
-    
-    def get_gobo_attributes(self, gobo: PrismGOBO) -> Dict[str, Any]:
-        return {
-            self.get_texture_attribute_name(): self.format_texture_reference(gobo.source_path, gobo.source_type),
-            "vray:light:texmap_scale_u": gobo.transform.scale_u,
-            "vray:light:texmap_scale_v": gobo.transform.scale_v,
-            "vray:light:texmap_rotate": gobo.transform.rotation,
-        }
+# Static parts of the pythonscript LOP code written by apply_to_light
+_APPLY_HEADER = "from pxr import Usd, Sdf, Gf\n\nnode = hou.pwd()\nstage = node.editableStage()\n"
+_APPLY_PRIM_TMPL = (
+    "prim_path = {p!r}\n\n"
+    "prim = stage.GetPrimAtPath(prim_path)\n"
+    "if not prim:\n"
+    '    raise RuntimeError("Prim not found: " + prim_path)'
+)
+_RENDERER_CODE_HEADINGS: Dict[Renderer, str] = {
+    r: f"\n# Prism GOBO for {r.value} (transform order: {a.transform_order.value})"
+    for r, a in _ADAPTERS.items()
+}
+# Per renderer: ('prim.CreateAttribute(..., <Sdf type>).Set(', getter); the value and ")" follow
+_RENDERER_CODE_SETTERS: Dict[Renderer, Tuple[Tuple[str, Callable[[PrismGOBO], Any]], ...]] = {
+    r: tuple(
+        (f'prim.CreateAttribute("{attr_name}", Sdf.ValueTypeNames.{sdf_type}).Set(', getter)
+        for attr_name, sdf_type, getter in a.attribute_schedule
+    )
+    for r, a in _ADAPTERS.items()
+}
 
 
 class RendererAdapterFactory:
-    """Thread-safe factory with double-checked locking"""
-    _adapters: Dict[Renderer, RendererAdapterBase] = {}
-    _lock = threading.Lock()
-    
-    _ADAPTER_CLASSES = {
-        Renderer.KARMA: KarmaRendererAdapter,
-        Renderer.ARNOLD: ArnoldRendererAdapter,
-        Renderer.RENDERMAN: RenderManRendererAdapter,
-        Renderer.REDSHIFT: RedshiftRendererAdapter,
-        Renderer.VRAY: VRayRendererAdapter,
-    }
+    """Lookup for the prebuilt renderer adapters"""
+    get_adapter = staticmethod(_ADAPTERS.__getitem__)
     
-    @classmethod
-    def get_adapter(cls, renderer: Renderer) -> RendererAdapterBase:
-        if renderer in cls._adapters:
-            return cls._adapters[renderer]
-        
-        with cls._lock:
-            if renderer not in cls._adapters:
-                cls._adapters[renderer] = cls._ADAPTER_CLASSES[renderer]()
-        
-        return cls._adapters[renderer]
-    
-    @classmethod
-    def get_all_adapters(cls) -> Dict[Renderer, RendererAdapterBase]:
-        for renderer in Renderer:
-            cls.get_adapter(renderer)
-        return dict(cls._adapters)
+    @staticmethod
+    def get_all_adapters() -> Dict[Renderer, RendererAdapterBase]:
+        return dict(_ADAPTERS)
 
 
 # =============================================================================
 # GOBO MANAGER
 # =============================================================================
 
+# Managers to flush at exit; weak so a closed panel's GOBO library can be freed
+_LIVE_MANAGERS: "weakref.WeakSet[PrismGOBOManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers():
+    """Write pending edits of every manager still alive"""
+    for manager in list(_LIVE_MANAGERS):
+        manager.flush()
+
+
+atexit.register(_flush_live_managers)
+
+
 class PrismGOBOManager:
     """Thread-safe cross-renderer GOBO manager"""
     
-    PRESET_DIR = Path(hou.expandString("$HOUDINI_USER_PREF_DIR")) / "prism_gobos"
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _preset_dir(cls) -> Path:
+        # Resolved on first use, not at import (hython/batch may not have it yet)
+        return Path(hou.expandString("$HOUDINI_USER_PREF_DIR")) / "prism_gobos"
     
     def __init__(self):
         self._gobos: Dict[str, PrismGOBO] = {}
-        self._lock = threading.RLock()
+        self._gobos_view = MappingProxyType(self._gobos)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # Serializes disk writes; readers only take _lock
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        _LIVE_MANAGERS.add(self)
         self._ensure_dir()
         self._load_gobos()
     
     def _ensure_dir(self):
         try:
-            self.PRESET_DIR.mkdir(parents=True, exist_ok=True)
+            self._preset_dir().mkdir(parents=True, exist_ok=True)
         except Exception as e:
             print(f"[Prism] Warning: {e}")
     
     def _load_gobos(self):
-        gobo_file = self.PRESET_DIR / "gobos.json"
+        gobo_file = self._preset_dir() / "gobos.json"
         if not gobo_file.exists():
             return
         
+        # Read and decode outside the lock; only the insert needs it
+        loaded: Dict[str, PrismGOBO] = {}
+        try:
+            # Already bytes for the decoder, so skip Python's buffering layer
+            with open(gobo_file, "rb", buffering=0) as f:
+                raw = f.read()
+            data = _load_json(raw)
+            
+            gobos_data = data.get("_gobos", data)
+            for name, g_data in gobos_data.items():
+                if name.startswith("_"):
+                    continue
+                try:
+                    loaded[name] = PrismGOBO.from_dict(g_data, validate=False)
+                except Exception as e:
+                    print(f"[Prism] Warning: Could not load '{name}': {e}")
+        except Exception as e:
+            print(f"[Prism] Error loading: {e}")
+        
         with self._lock:
-            try:
-                with open(gobo_file, 'r') as f:
-                    data = json.load(f)
-                
-                gobos_data = data.get("_gobos", data)
-                for name, g_data in gobos_data.items():
-                    if name.startswith("_"):
-                        continue
-                    try:
-                        self._gobos[name] = PrismGOBO.from_dict(g_data)
-                    except Exception as e:
-                        print(f"[Prism] Warning: Could not load '{name}': {e}")
-            except Exception as e:
-                print(f"[Prism] Error loading: {e}")
+            self._gobos.update(loaded)
     
     def _save_gobos(self):
-        gobo_file = self.PRESET_DIR / "gobos.json"
-        
+        """Mark the library dirty; it is written once the debounce timer fires"""
         with self._lock:
-            try:
-                import datetime
-                data = {
-                    "_schema_version": SCHEMA_VERSION,
-                    "_product": __product__,
-                    "_saved_at": datetime.datetime.now().isoformat(),
-                    "_gobos": {name: gobo.to_dict() for name, gobo in self._gobos.items()}
-                }
-                with open(gobo_file, 'w') as f:
-                    json.dump(data, f, indent=2)
-            except Exception as e:
-                print(f"[Prism] Error saving: {e}")
+            self._dirty = True
+            if self._flush_timer is not None:
+                return
+            timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+        timer.start()
+    
+    def flush(self):
+        """Write pending library changes now"""
+        # _save_lock keeps writes in snapshot order; _lock is only held for the snapshot
+        with self._save_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                gobos_data = {name: gobo.to_dict() for name, gobo in self._gobos.items()}
+            self._do_save(gobos_data)
+    
+    def _do_save(self, gobos_data: Dict[str, Dict]):
+        gobo_file = self._preset_dir() / "gobos.json"
+        
+        try:
+            data = {
+                "_schema_version": SCHEMA_VERSION,
+                "_product": __product__,
+                "_saved_at": datetime.now().isoformat(),
+                "_gobos": gobos_data
+            }
+            # Write a sibling file and swap it in so a crash never leaves half a library
+            tmp_file = gobo_file.with_suffix(".json.tmp")
+            _write_file_bytes(tmp_file, _dump_json(data))
+            os.replace(tmp_file, gobo_file)
+        except Exception as e:
+            print(f"[Prism] Error saving: {e}")
     
     @property
-    def gobos(self) -> Dict[str, PrismGOBO]:
-        with self._lock:
-            return dict(self._gobos)
+    def gobos(self) -> Mapping[str, PrismGOBO]:
+        """Live read-only view of the library (copy it before mutating the manager mid-iteration)"""
+        return self._gobos_view
     
     def get_gobo(self, name: str) -> Optional[PrismGOBO]:
         with self._lock:
             return self._gobos.get(name)
     
     def create_gobo(self, gobo: PrismGOBO) -> Tuple[bool, str]:
+        now = datetime.now().isoformat()
         with self._lock:
-            import datetime
-            gobo.created_at = datetime.datetime.now().isoformat()
-            gobo.modified_at = gobo.created_at
+            gobo.created_at = gobo.modified_at = now
             self._gobos[gobo.name] = gobo
-            self._save_gobos()
+        self._save_gobos()
         return True, f"Created: {gobo.name}"
     
+    def create_gobos_bulk(self, gobos: List[PrismGOBO]) -> List[Tuple[bool, str]]:
+        """Create many GOBOs with one timestamp and one queued save"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            for gobo in gobos:
+                gobo.created_at = gobo.modified_at = now
+                self._gobos[gobo.name] = gobo
+        self._save_gobos()
+        return [(True, f"Created: {gobo.name}") for gobo in gobos]
+    
     def update_gobo(self, name: str, gobo: PrismGOBO) -> Tuple[bool, str]:
+        now = datetime.now().isoformat()
         with self._lock:
             if name not in self._gobos:
                 return False, f"Not found: {name}"
             
-            import datetime
-            gobo.modified_at = datetime.datetime.now().isoformat()
+            gobo.modified_at = now
             gobo.created_at = self._gobos[name].created_at
             
             if name != gobo.name:
                 del self._gobos[name]
             
             self._gobos[gobo.name] = gobo
-            self._save_gobos()
+        self._save_gobos()
         return True, f"Updated: {gobo.name}"
     
     def delete_gobo(self, name: str) -> Tuple[bool, str]:
@@ -562,42 +698,39 @@ class PrismGOBOManager:
             if name not in self._gobos:
                 return False, f"Not found: {name}"
             del self._gobos[name]
-            self._save_gobos()
+        self._save_gobos()
         return True, f"Deleted: {name}"
     
+    @staticmethod
+    def _code_header(prim_path: str) -> List[str]:
+        return [_APPLY_HEADER, _APPLY_PRIM_TMPL.format(p=prim_path)]
+    
+    @staticmethod
+    def _renderer_code(gobo: PrismGOBO, renderer: Renderer) -> List[str]:
+        code_lines = [_RENDERER_CODE_HEADINGS[renderer]]
+        # repr() quotes strings and writes floats/bools as Python literals
+        code_lines.extend(prefix + repr(getter(gobo)) + ")" for prefix, getter in _RENDERER_CODE_SETTERS[renderer])
+        return code_lines
+    
+    def _build_multi_renderer_code(self, gobo: PrismGOBO, prim_path: str) -> str:
+        """Script that writes every renderer's GOBO attributes in one pass"""
+        code_lines = self._code_header(prim_path)
+        for renderer in Renderer:
+            code_lines.extend(self._renderer_code(gobo, renderer))
+        return "\n".join(code_lines)
+    
+    def _create_script_lop(self, lop_node: hou.LopNode, name: str, code: str) -> hou.LopNode:
+        python_lop = lop_node.parent().createNode("pythonscript", name)
+        python_lop.setInput(0, lop_node)
+        python_lop.parm("python").set(code)
+        python_lop.moveToGoodPosition()
+        return python_lop
+    
     def apply_to_light(self, gobo: PrismGOBO, lop_node: hou.LopNode, prim_path: str, renderer: Renderer) -> Tuple[bool, str]:
         try:
-            adapter = RendererAdapterFactory.get_adapter(renderer)
-            attrs = adapter.get_gobo_attributes(gobo)
-            
-            parent = lop_node.parent()
-            python_lop = parent.createNode("pythonscript", f"prism_{gobo.name.replace(' ', '_')}")
-            python_lop.setInput(0, lop_node)
-            
-            code_lines = [
-                "from pxr import Usd, Sdf, Gf",
-                "",
-                "node = hou.pwd()",
-                "stage = node.editableStage()",
-                f'prim_path = "{prim_path}"',
-                "",
-                "prim = stage.GetPrimAtPath(prim_path)",
-                "if not prim:",
-                f'    raise RuntimeError("Prim not found: {prim_path}")',
-                "",
-                f"# Prism GOBO for {renderer.value} (transform order: {adapter.transform_order.value})",
-            ]
-            
-            for attr_name, attr_value in attrs.items():
-                if isinstance(attr_value, str):
-                    code_lines.append(f'prim.CreateAttribute("{attr_name}", Sdf.ValueTypeNames.String).Set("{attr_value}")')
-                elif isinstance(attr_value, bool):
-                    code_lines.append(f'prim.CreateAttribute("{attr_name}", Sdf.ValueTypeNames.Bool).Set({attr_value})')
-                elif isinstance(attr_value, float):
-                    code_lines.append(f'prim.CreateAttribute("{attr_name}", Sdf.ValueTypeNames.Float).Set({attr_value})')
-            
-            python_lop.parm("python").set("\n".join(code_lines))
-            python_lop.moveToGoodPosition()
+            code_lines = self._code_header(prim_path)
+            code_lines.extend(self._renderer_code(gobo, renderer))
+            self._create_script_lop(lop_node, f"prism_{gobo.name.replace(' ', '_')}", "\n".join(code_lines))
             
             return True, f"Applied '{gobo.name}' to {prim_path} ({renderer.value})"
             
@@ -606,10 +739,20 @@ class PrismGOBOManager:
             return False, f"Error: {e}"
     
     def apply_to_all_renderers(self, gobo: PrismGOBO, lop_node: hou.LopNode, prim_path: str) -> Dict[Renderer, Tuple[bool, str]]:
-        results = {}
-        for renderer in Renderer:
-            results[renderer] = self.apply_to_light(gobo, lop_node, prim_path, renderer)
-        return results
+        # One pythonscript LOP for all renderers, so the stage is edited and cooked once
+        try:
+            self._create_script_lop(
+                lop_node, f"prism_{gobo.name.replace(' ', '_')}_all",
+                self._build_multi_renderer_code(gobo, prim_path)
+            )
+        except Exception as e:
+            traceback.print_exc()
+            return {renderer: (False, f"Error: {e}") for renderer in Renderer}
+        
+        return {
+            renderer: (True, f"Applied '{gobo.name}' to {prim_path} ({renderer.value})")
+            for renderer in Renderer
+        }
 
 
 # =============================================================================
@@ -978,6 +1121,10 @@ class PrismPanel(QtWidgets.QWidget):
         success, msg = self.manager.apply_to_light(gobo, lop_node, light_path, renderer)
         self._set_status(msg, "success" if success else "error")
     
+    def closeEvent(self, event):
+        self.manager.flush()
+        super().closeEvent(event)
+    
     def _set_status(self, message: str, status_type: str = "info"):
         colors = {"success": "#7D8B69", "error": "#8B4513", "info": "#B4846C"}
         self.status_label.setStyleSheet(f"color: {colors.get(status_type, '#888')};")
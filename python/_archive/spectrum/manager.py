@@ -5,7 +5,6 @@ Central manager for material lookdev workflows.
 Coordinates materials, textures, environments, and preview system.
 """
 
-import json
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Callable, Tuple
@@ -22,6 +21,7 @@ from .environments import EnvironmentManager, get_environment_manager
 from core.determinism import deterministic_uuid
 from core.audit import audit_log, AuditCategory, AuditLevel
 from core.gates import propose_change, GateLevel, GateProposal
+from core.jsonio import write_json, read_json
 
 
 @dataclass
@@ -427,8 +427,7 @@ class SpectrumManager:
             "preview_configs": {k: v.to_dict() for k, v in self._preview_configs.items()},
         }
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        write_json(path, data)
 
         # Also save materials library
         materials_path = path.parent / f"{path.stem}_materials.json"
@@ -447,8 +446,7 @@ class SpectrumManager:
         if not path.exists():
             return False
 
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(path)
 
         self._session = SpectrumSession.from_dict(data.get("session", {}))
 
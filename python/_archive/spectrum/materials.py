@@ -5,7 +5,6 @@ Material library, assignment rules, and preset management for USD/Solaris.
 Integrates with human gates for material changes.
 """
 
-import json
 import fnmatch
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -19,7 +18,7 @@ from .models import (
 from core.determinism import deterministic_uuid, deterministic_sort
 from core.audit import audit_log, AuditCategory, AuditLevel
 from core.gates import propose_change, GateLevel, GateProposal
-
+from core.jsonio import write_json, read_json
 
 # Standard shader parameter templates for common material types
 KARMA_PRINCIPLED_DEFAULTS = [
@@ -450,8 +449,7 @@ class MaterialLibrary:
             "assignment_rules": {k: v.to_dict() for k, v in self._assignment_rules.items()},
         }
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        write_json(path, data)
 
         audit_log().log(
             operation="save_material_library",
@@ -466,8 +464,7 @@ class MaterialLibrary:
         if not path.exists():
             return False
 
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(path)
 
         self._materials = {
             k: Material.from_dict(v)
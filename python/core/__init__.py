@@ -5,6 +5,7 @@ Provides:
 - Determinism layer (strict reproducibility)
 - Audit logging
 - Human gate system
+- JSON file I/O (orjson when available)
 - Synapse command registration
 """
 from .determinism import (
@@ -20,6 +21,7 @@ from .audit import (
     AuditEntry,
     AuditLevel,
     AuditCategory,
+    AsyncAuditSink,
     audit_log,
 )
 from .gates import (
@@ -30,6 +32,13 @@ from .gates import (
     GateBatch,
     human_gate,
     propose_change,
+    snapshot_changes,
+)
+from .jsonio import (
+    write_json,
+    read_json,
+    append_jsonl,
+    read_jsonl,
 )
 
 __all__ = [
@@ -45,6 +54,7 @@ __all__ = [
     'AuditEntry',
     'AuditLevel',
     'AuditCategory',
+    'AsyncAuditSink',
     'audit_log',
     # Gates
     'HumanGate',
@@ -54,4 +64,10 @@ __all__ = [
     'GateBatch',
     'human_gate',
     'propose_change',
+    'snapshot_changes',
+    # JSON I/O
+    'write_json',
+    'read_json',
+    'append_jsonl',
+    'read_jsonl',
 ]
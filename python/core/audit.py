@@ -12,6 +12,9 @@ Logs are append-only, tamper-evident (hash chain), and human-readable.
 
 import json
 import time
+import logging
+import queue
+import atexit
 import hashlib
 import threading
 from pathlib import Path
@@ -21,6 +24,8 @@ from enum import Enum
 
 from .determinism import deterministic_uuid, deterministic_dict_items
 
+logger = logging.getLogger(__name__)
+
 
 class AuditLevel(Enum):
     """Severity/importance levels for audit entries"""
@@ -49,6 +54,10 @@ class AuditCategory(Enum):
     SYSTEM = "system"
 
 
+# Levels that are always persisted synchronously, even via log_async
+_SYNC_PERSIST_LEVELS = frozenset((AuditLevel.ERROR, AuditLevel.CRITICAL))
+
+
 @dataclass
 class AuditEntry:
     """Single audit log entry with hash chain integrity"""
@@ -156,6 +165,113 @@ class AuditEntry:
         )
 
 
+# Queue marker that makes the writer stop batching and write immediately
+_FLUSH = object()
+
+
+class AsyncAuditSink:
+    """
+    Background writer that persists audit entries in batches.
+
+    Entries are queued by the caller and drained by a daemon thread,
+    which hands up to max_batch entries at a time (or whatever arrived
+    within max_wait seconds) to the write callback.
+
+    Usage:
+        sink = AsyncAuditSink(write_batch=log._persist_batch)
+        sink.submit(entry)
+        sink.flush()  # Block until everything queued is written
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List['AuditEntry']], None],
+        max_batch: int = 64,
+        max_wait: float = 0.1,
+        max_queue: int = 10000,
+    ):
+        self._write_batch = write_batch
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._queue: "queue.Queue[AuditEntry]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # Entries whose write failed, retried ahead of the next batch
+        self._failed: List[AuditEntry] = []
+        self._write_lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread on first use"""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="AuditSinkWriter", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, entry: 'AuditEntry') -> None:
+        """Queue entry for persistence (blocks while the queue is full)"""
+        self._ensure_started()
+        self._queue.put(entry)
+
+    def flush(self) -> None:
+        """
+        Block until all queued entries have been written.
+
+        Batches the writer thread failed to persist are retried here, and
+        a write error is raised to the caller instead of being dropped.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_FLUSH)  # Wake the writer instead of waiting out max_wait
+        self._queue.join()
+        with self._write_lock:
+            if self._failed:
+                self._write_batch(self._failed)
+                self._failed = []
+
+    def _write(self, batch: List['AuditEntry']) -> None:
+        """Write batch after any earlier failed entries, keeping failures for retry"""
+        with self._write_lock:
+            pending = self._failed + batch if self._failed else batch
+            try:
+                self._write_batch(pending)
+            except Exception:
+                # Keep the entries (in chain order) so a later write or flush() retries them
+                self._failed = pending
+                logger.exception("Audit write failed; %d entries kept for retry", len(pending))
+            else:
+                self._failed = []
+
+    def _run(self) -> None:
+        """Writer loop: collect a batch, write it, repeat"""
+        while True:
+            item = self._queue.get()
+            batch = [] if item is _FLUSH else [item]
+            taken = 1
+            deadline = time.monotonic() + self._max_wait
+            while item is not _FLUSH and len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is not _FLUSH:
+                    batch.append(item)
+
+            try:
+                if batch:
+                    self._write(batch)
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+
 class AuditLog:
     """
     Thread-safe audit log with hash chain integrity.
@@ -175,6 +291,10 @@ class AuditLog:
         self._current_session = deterministic_uuid(str(time.time()), "session")
         self._last_hash = "genesis"
         self._write_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+
+        # Background persistence for log_async (created on first use)
+        self._sink: Optional[AsyncAuditSink] = None
 
         # Callbacks for real-time monitoring
         self._callbacks: List[Callable[[AuditEntry], None]] = []
@@ -191,6 +311,8 @@ class AuditLog:
     def reset_instance(cls) -> None:
         """Reset singleton (for testing)"""
         with cls._lock:
+            if cls._instance is not None:
+                cls._instance.flush()
             cls._instance = None
 
     def add_callback(self, callback: Callable[[AuditEntry], None]) -> None:
@@ -214,6 +336,7 @@ class AuditLog:
         input_data: Optional[Dict[str, Any]] = None,
         output_data: Optional[Dict[str, Any]] = None,
         sequence_id: str = "",
+        deferred: bool = False,
     ) -> AuditEntry:
         """
         Log an audit entry.
@@ -229,6 +352,7 @@ class AuditLog:
             input_data: Input parameters
             output_data: Output/result data
             sequence_id: Shot/sequence identifier
+            deferred: Persist via the background sink instead of inline
 
         Returns:
             Created AuditEntry
@@ -253,8 +377,15 @@ class AuditLog:
             self._entries.append(entry)
             self._last_hash = entry.entry_hash
 
-            # Write to disk
-            self._persist_entry(entry)
+            # Write to disk; once a sink exists every entry goes through it,
+            # so the file keeps chain order
+            sink = self._sink
+            if deferred:
+                self._get_sink().submit(entry)
+            elif sink is not None:
+                sink.submit(entry)
+            else:
+                self._persist_entry(entry)
 
             # Notify callbacks
             for callback in self._callbacks:
@@ -263,7 +394,45 @@ class AuditLog:
                 except Exception:
                     pass  # Don't let callback errors break logging
 
-            return entry
+        if not deferred and sink is not None:
+            # Wait outside _write_lock so other loggers are not stalled
+            sink.flush()
+
+        return entry
+
+    def log_async(
+        self,
+        operation: str,
+        message: str,
+        level: AuditLevel = AuditLevel.INFO,
+        **kwargs
+    ) -> AuditEntry:
+        """
+        Log an entry without blocking on disk I/O.
+
+        The entry is chained and visible to queries immediately; only the
+        file write is handed to a background thread. ERROR and CRITICAL
+        entries are still written synchronously, after any queued entries.
+        """
+        return self.log(
+            operation=operation,
+            message=message,
+            level=level,
+            deferred=level not in _SYNC_PERSIST_LEVELS,
+            **kwargs
+        )
+
+    def flush(self) -> None:
+        """Block until all deferred entries have been written"""
+        if self._sink is not None:
+            self._sink.flush()
+
+    def _get_sink(self) -> AsyncAuditSink:
+        """Get (or create) the background persistence sink"""
+        if self._sink is None:
+            self._sink = AsyncAuditSink(write_batch=self._persist_batch)
+            atexit.register(self._sink.flush)
+        return self._sink
 
     def log_agent_action(
         self,
@@ -308,9 +477,23 @@ class AuditLog:
         date_str = entry.timestamp_utc[:10]
         log_file = self._log_dir / f"audit_{date_str}.jsonl"
 
-        with open(log_file, 'a', encoding='utf-8') as f:
+        with self._file_lock, open(log_file, 'a', encoding='utf-8') as f:
             f.write(json.dumps(entry.to_dict()) + '\n')
 
+    def _persist_batch(self, entries: List[AuditEntry]) -> None:
+        """Write several entries with one open per daily log file"""
+        by_file: Dict[str, List[str]] = {}
+        for entry in entries:
+            by_file.setdefault(entry.timestamp_utc[:10], []).append(
+                json.dumps(entry.to_dict()) + '\n'
+            )
+
+        with self._file_lock:
+            for date_str, lines in by_file.items():
+                log_file = self._log_dir / f"audit_{date_str}.jsonl"
+                with open(log_file, 'a', encoding='utf-8') as f:
+                    f.write(''.join(lines))
+
     def get_entries(
         self,
         level: Optional[AuditLevel] = None,
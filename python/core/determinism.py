@@ -18,7 +18,7 @@ import hashlib
 import time
 from dataclasses import dataclass, field
 from typing import Tuple, List, Any, Dict, Optional, TypeVar, Callable
-from functools import wraps
+from functools import wraps, lru_cache
 from decimal import Decimal, ROUND_HALF_UP
 
 __version__ = "1.0.0"
@@ -86,13 +86,23 @@ def round_float(value: float, precision: Optional[int] = None) -> float:
 
     if _config.strict_mode:
         # Use Decimal for exact rounding (slower but deterministic)
-        d = Decimal(str(value))
-        rounded = d.quantize(Decimal(10) ** -precision, rounding=ROUND_HALF_UP)
-        return float(rounded)
+        return _quantize(str(value), precision)
     else:
         return round(value, precision)
 
 
+@lru_cache(maxsize=8192)
+def _quantize(text: str, precision: int) -> float:
+    """
+    Memoized Decimal rounding behind strict-mode round_float.
+
+    Keyed on the float's string form, so values that compare equal but
+    print differently (0.0 / -0.0) keep their own results.
+    """
+    rounded = Decimal(text).quantize(Decimal(10) ** -precision, rounding=ROUND_HALF_UP)
+    return float(rounded)
+
+
 def round_vector(
     vector: Tuple[float, ...],
     precision: Optional[int] = None
@@ -131,7 +141,13 @@ def deterministic_uuid(content: str, namespace: str = "radiant") -> str:
     Returns:
         16-character hex string (deterministic)
     """
-    full_content = f"{namespace}:{_config.tool_version}:{content}"
+    return _hashed_uuid(namespace, _config.tool_version, content)
+
+
+@lru_cache(maxsize=4096)
+def _hashed_uuid(namespace: str, tool_version: str, content: str) -> str:
+    """Memoized hash behind deterministic_uuid (tool_version is part of the key)"""
+    full_content = f"{namespace}:{tool_version}:{content}"
     return hashlib.sha256(full_content.encode('utf-8')).hexdigest()[:16]
 
 
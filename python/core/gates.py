@@ -13,6 +13,7 @@ Gate Levels:
 
 import json
 import time
+import pickle
 import threading
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -60,6 +61,11 @@ class GateProposal:
     preview_data: Dict[str, Any] = field(default_factory=dict)
     rollback_data: Dict[str, Any] = field(default_factory=dict)
 
+    # Pickled snapshot of the proposed objects (protocol 5). When set,
+    # proposed_changes is materialized from it on first access. In-memory
+    # only: to_dict() stores the rendered dict, never the pickle.
+    proposed_changes_blob: bytes = field(default=b"", repr=False)
+
     # Agent context
     agent_id: str = ""
     reasoning: str = ""
@@ -83,6 +89,40 @@ class GateProposal:
             content = f"{self.gate_id}:{self.operation}:{self.created_at}"
             self.proposal_id = deterministic_uuid(content, "proposal")
 
+    def snapshot(self) -> Any:
+        """Get an independent copy of the pickled proposed objects"""
+        if not self.proposed_changes_blob:
+            return None
+        return pickle.loads(self.proposed_changes_blob)
+
+    def get_proposed_changes(self) -> Dict[str, Any]:
+        """
+        Get proposed changes as a plain dict.
+
+        Blob-backed proposals are rendered on demand: objects with a
+        to_dict() are converted, and the result is kept for later calls.
+        A render failure is audit-logged and returned as a "_render_error"
+        entry, so reviewers never see it as an empty change set.
+        """
+        if not self.proposed_changes and self.proposed_changes_blob:
+            try:
+                changes = _render_changes(self.snapshot())
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                changes = {"_render_error": error}
+                audit_log().log(
+                    operation="render_proposed_changes",
+                    message=f"Could not render proposed changes for {self.operation}: {error}",
+                    level=AuditLevel.WARNING,
+                    category=AuditCategory.GATE,
+                    sequence_id=self.sequence_id,
+                    input_data={"proposal_id": self.proposal_id},
+                )
+            if not isinstance(changes, dict):
+                changes = {"value": changes}
+            self.proposed_changes = changes
+        return self.proposed_changes
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize for storage/transmission"""
         return {
@@ -93,7 +133,7 @@ class GateProposal:
             "description": self.description,
             "category": self.category.value,
             "level": self.level.value,
-            "proposed_changes": self.proposed_changes,
+            "proposed_changes": self.get_proposed_changes(),
             "preview_data": self.preview_data,
             "rollback_data": self.rollback_data,
             "agent_id": self.agent_id,
@@ -146,10 +186,21 @@ class GateProposal:
             f"Agent Confidence: [{confidence_bar}] {self.confidence:.0%}\n"
             f"\n{self.description}\n"
             f"\nReasoning: {self.reasoning}\n"
-            f"\nProposed Changes:\n{json.dumps(self.proposed_changes, indent=2)}\n"
+            f"\nProposed Changes:\n{json.dumps(self.get_proposed_changes(), indent=2)}\n"
         )
 
 
+def _render_changes(value: Any) -> Any:
+    """Recursively convert snapshot objects to JSON-compatible data"""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {k: _render_changes(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_render_changes(v) for v in value]
+    return value
+
+
 @dataclass
 class GateBatch:
     """Collection of proposals for batch review"""
@@ -274,6 +325,7 @@ class HumanGate:
         agent_id: str = "",
         reasoning: str = "",
         confidence: float = 0.5,
+        proposed_changes_blob: bytes = b"",
     ) -> GateProposal:
         """
         Propose a change for human review.
@@ -282,6 +334,9 @@ class HumanGate:
         For REVIEW level: adds to batch for later review
         For APPROVE/CRITICAL: would block (but we return proposal for async handling)
 
+        Large object graphs can be passed as proposed_changes_blob (see
+        snapshot_changes) instead of a pre-rendered proposed_changes dict.
+
         Returns:
             GateProposal with decision=PENDING (or APPROVED for INFORM)
         """
@@ -302,6 +357,7 @@ class HumanGate:
                 proposed_changes=proposed_changes or {},
                 preview_data=preview_data or {},
                 rollback_data=rollback_data or {},
+                proposed_changes_blob=proposed_changes_blob,
                 agent_id=agent_id,
                 reasoning=reasoning,
                 confidence=confidence,
@@ -323,7 +379,7 @@ class HumanGate:
                     level=AuditLevel.INFO,
                     category=category,
                     agent_id=agent_id,
-                    input_data=proposed_changes or {},
+                    input_data=proposal.get_proposed_changes(),
                 )
             else:
                 # Add to batch for this sequence
@@ -440,7 +496,7 @@ class HumanGate:
                 input_data={
                     "proposal_id": proposal_id,
                     "decision": decision.value,
-                    "original_changes": proposal.proposed_changes,
+                    "original_changes": proposal.get_proposed_changes(),
                     "modified_changes": modified_changes,
                 },
             )
@@ -551,6 +607,11 @@ def human_gate() -> HumanGate:
     return HumanGate.get_instance()
 
 
+def snapshot_changes(obj: Any) -> bytes:
+    """Pickle an object graph for GateProposal.proposed_changes_blob"""
+    return pickle.dumps(obj, protocol=5)
+
+
 def propose_change(
     operation: str,
     description: str,
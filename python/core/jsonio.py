@@ -0,0 +1,51 @@
+"""
+RadiantSuite JSON I/O
+
+Shared file helpers for tool sessions and libraries.
+Uses orjson when it is installed and the stdlib encoder otherwise;
+both produce the same documents.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+# orjson is optional; it serializes large sessions and libraries several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write JSON file, using orjson when available"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+
+def read_json(path: Path) -> Dict[str, Any]:
+    """Read JSON file, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def append_jsonl(path: Path, records: List[Dict[str, Any]]) -> None:
+    """Append records to a JSON Lines file"""
+    if orjson is not None:
+        payload = b"".join(orjson.dumps(r) + b"\n" for r in records)
+    else:
+        payload = "".join(json.dumps(r) + "\n" for r in records).encode('utf-8')
+    with open(path, 'ab') as f:
+        f.write(payload)
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """Read all records from a JSON Lines file"""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, 'rb') as f:
+        return [loads(line) for line in f if line.strip()]
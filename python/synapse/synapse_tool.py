@@ -57,7 +57,7 @@ import queue
 import time
 import traceback
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple, Callable, Set
+from typing import Optional, Dict, Any, List, Tuple, Callable, Set, Iterable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from collections import OrderedDict
@@ -372,6 +372,14 @@ class CommandHandlerRegistry:
         if validator:
             self._validators[command_type] = validator
     
+    def register_many(self, entries: Iterable[Tuple[str, Callable, Optional[Callable]]]):
+        """Register (command_type, handler, validator) rows in one pass"""
+        entries = list(entries)
+        self._handlers.update((command_type, handler) for command_type, handler, _ in entries)
+        self._validators.update(
+            (command_type, validator) for command_type, _, validator in entries if validator
+        )
+    
     def validate(self, command: SynapseCommand) -> Optional[str]:
         validator = self._validators.get(command.type)
         if validator:
@@ -403,6 +411,16 @@ class CommandHandlerRegistry:
         
         try:
             result = handler(command.payload)
+            # Handlers may report expected misses without raising:
+            # {"ok": False, "error": <code>, "message": <text>, ...}
+            if type(result) is dict and result.get("ok") is False:
+                return SynapseResponse(
+                    id=command.id,
+                    success=False,
+                    data=result,
+                    error=result.get("message") or result.get("error"),
+                    sequence=command.sequence
+                )
             return SynapseResponse(
                 id=command.id,
                 success=True,
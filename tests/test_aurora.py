@@ -104,6 +104,59 @@ def test_audit():
     assert len(entries) >= 1, "Query failed"
     print(f"  [PASS] Query returned {len(entries)} entries")
 
+    # Deferred persistence still chains and queries immediately
+    entry3 = log.log_async(
+        operation="test_op_3",
+        message="Deferred test entry",
+        category=AuditCategory.LIGHTING,
+        tool="test",
+    )
+    assert entry3.previous_hash == entry2.entry_hash, "Async entry not chained"
+    log.flush()
+    is_valid, _ = log.verify_chain()
+    assert is_valid, "Chain invalid after async log"
+    print("  [PASS] Async log chained and flushed")
+
+    # Synchronous levels land on disk after earlier deferred entries
+    queued = [
+        log.log_async(operation=f"test_op_q{i}", message="Queued entry", tool="test")
+        for i in range(5)
+    ]
+    error = log.log_async(operation="test_op_err", message="Error entry",
+                          level=AuditLevel.ERROR, tool="test")
+    log_file = log._log_dir / f"audit_{error.timestamp_utc[:10]}.jsonl"
+    on_disk = log_file.read_text(encoding="utf-8")
+    positions = [on_disk.find(e.entry_hash) for e in queued + [error]]
+    assert -1 not in positions, "Queued entries not written before error entry"
+    assert positions == sorted(positions), "File order differs from chain order"
+    print("  [PASS] Sync entries keep chain order on disk")
+
+    # Failed batches are kept and retried, and flush() surfaces the error
+    from core.audit import AsyncAuditSink
+    written, failures = [], [OSError("disk full")]
+
+    def flaky_write(batch):
+        if failures:
+            raise failures.pop()
+        written.extend(batch)
+
+    sink = AsyncAuditSink(write_batch=flaky_write, max_wait=0.01)
+    sink.submit(entry1)
+    sink.submit(entry2)
+    sink.flush()
+    assert written == [entry1, entry2], "Failed batch not retried"
+    failures.extend([OSError("disk full"), OSError("still full")])
+    sink.submit(entry3)
+    try:
+        sink.flush()
+    except OSError:
+        pass
+    else:
+        raise AssertionError("flush() swallowed the write error")
+    sink.flush()
+    assert written == [entry1, entry2, entry3], "Entry lost after failed writes"
+    print("  [PASS] Failed audit writes retried")
+
     print("  All audit tests passed!")
     return True
 
@@ -167,6 +220,33 @@ def test_gates():
     summary = batch.summary()
     print(f"  [PASS] Batch summary: {summary}")
 
+    # Blob-backed proposals keep the pickle in memory and store the rendered dict
+    from core.gates import GateProposal, snapshot_changes
+    proposal3 = gate.propose(
+        operation="create_light_group",
+        description="Create fill group from snapshot",
+        sequence_id="shot_020",
+        category=AuditCategory.LIGHTING,
+        proposed_changes_blob=snapshot_changes({"name": "fill", "lights": ["/a"]}),
+    )
+    assert proposal3.get_proposed_changes() == {"name": "fill", "lights": ["/a"]}
+    assert proposal3.snapshot() == {"name": "fill", "lights": ["/a"]}
+    # Storage keeps the readable dict; the pickle never leaves the process
+    stored = proposal3.to_dict()
+    assert "proposed_changes_blob" not in stored, "Pickle blob persisted"
+    assert stored["proposed_changes"] == {"name": "fill", "lights": ["/a"]}
+    restored = GateProposal.from_dict(stored)
+    assert restored.snapshot() is None, "Restored proposal carries a pickle"
+    assert restored.get_proposed_changes() == {"name": "fill", "lights": ["/a"]}
+    # An unreadable snapshot is flagged, not shown as an empty change set
+    broken = GateProposal(
+        proposal_id="", gate_id="test", sequence_id="shot_020", operation="create_light_group",
+        description="Broken snapshot", category=AuditCategory.LIGHTING,
+        level=GateLevel.REVIEW, proposed_changes_blob=b"not a pickle",
+    )
+    assert "_render_error" in broken.get_proposed_changes(), "Render failure hidden"
+    print("  [PASS] Snapshot blob proposals")
+
     print("  All gate tests passed!")
     return True
 
@@ -207,6 +287,19 @@ def test_aurora_models():
     assert len(group_restored.members) == len(group.members), "Members lost in serialization"
     print("  [PASS] Serialization round-trip")
 
+    # Indexed member lookup and removal
+    assert group.has_light("/World/Lights/key_fill"), "Member lookup failed"
+    group.add_light("/World/Lights/key_rim", LightType.RECT)
+    removed = group.remove_lights_bulk(["/World/Lights/key_rim", "/World/Lights/missing"])
+    assert [m.prim_path for m in removed] == ["/World/Lights/key_rim"], "Bulk removal wrong"
+    assert not group.has_light("/World/Lights/key_rim"), "Removed light still indexed"
+    print("  [PASS] Member index")
+
+    # Models are slotted (no per-instance __dict__)
+    for obj in (group, group.members[0]):
+        assert not hasattr(obj, "__dict__"), f"{type(obj).__name__} has __dict__"
+    print("  [PASS] Slotted models")
+
     # AOV definition
     aov = AOVDefinition(
         name="key_lights_diffuse",
@@ -339,6 +432,21 @@ def test_light_linking():
     relationships = linker.resolve(lights, geometry)
     print(f"  [PASS] Resolved {len(relationships)} relationships")
 
+    # Batched matching agrees with per-pair pattern checks
+    rules = linker.get_rules()
+    for rel in relationships:
+        expected = [
+            r.name for r in rules
+            if linker._matches_pattern(rel.light_path, r.light_pattern)
+            and linker._matches_pattern(rel.geometry_path, r.geometry_pattern)
+        ]
+        assert rel.rule_source == (expected[-1] if expected else "default"), \
+            f"Rule mismatch for {rel.light_path} -> {rel.geometry_path}"
+    key_wall = [r for r in relationships
+                if r.light_path.endswith("key_main") and r.geometry_path.endswith("wall")]
+    assert not key_wall, "Exclude rule not applied"
+    print("  [PASS] Batched rule matching")
+
     # Generate collections
     collections = linker.generate_collections(lights, geometry)
     assert len(collections) == 2, f"Wrong collection count: {len(collections)}"
@@ -361,6 +469,25 @@ def test_light_linking():
     assert "rules" in linker_dict, "Missing rules in serialization"
     print("  [PASS] Linker serialization")
 
+    # Bulk add bumps the revision once
+    from aurora.models import LightLinkRule
+    revision = linker.revision
+    linker.add_rules([
+        LightLinkRule(name=f"bulk_{i}", light_pattern="/World/Lights/*",
+                      geometry_pattern=f"/World/Geo/prop_{i}")
+        for i in range(3)
+    ])
+    assert linker.revision == revision + 1, "Bulk add should bump revision once"
+    assert len(linker.get_rules()) == len(rules) + 2 + 3, "Bulk rules not added"
+    print("  [PASS] Bulk rule add")
+
+    # Rule dicts are cached until a field changes
+    cached = rule2._serialized()
+    assert rule2._serialized() is cached, "Rule dict not cached"
+    rule2.description = "edited"
+    assert rule2.to_dict()["description"] == "edited", "Stale rule dict"
+    print("  [PASS] Rule dict cache")
+
     print("  All linking tests passed!")
     return True
 
@@ -406,8 +533,32 @@ def test_aurora_manager():
     # Get groups
     groups = mgr.get_light_groups()
     assert len(groups) >= 1, "No groups returned"
+    assert mgr.get_light_groups() is groups, "Groups view not cached"
     print(f"  [PASS] Get groups: {len(groups)} groups")
 
+    # Polling with the last seen version skips unchanged state
+    from aurora.synapse_commands import AuroraCommandHandler
+    handler = AuroraCommandHandler()
+    listing = handler._handle_get_groups({})
+    assert listing["count"] == len(groups), "Handler group count mismatch"
+    repeat = handler._handle_get_groups({"since_version": listing["version"]})
+    assert repeat == {"unchanged": True, "version": listing["version"]}, "Unchanged poll not short-circuited"
+    listing["groups"][0]["members"][0]["prim_path"] = "/mutated"
+    listing["groups"][0]["name"] = "mutated"
+    fresh = handler._handle_get_groups({})["groups"]
+    assert fresh[0]["name"] != "mutated", "Listing shares the group's cached dict"
+    assert fresh[0]["members"][0]["prim_path"] != "/mutated", "Listing shares member cached dicts"
+    member = group.members[0]
+    member.enabled = False
+    edited = handler._handle_get_groups({})["groups"]
+    edited_group = next(g for g in edited if g["name"] == "key_lights")
+    assert edited_group["members"][0]["enabled"] is False, "Stale member in group listing"
+    member.enabled = True
+    group.generate_shadow = True
+    assert group.to_dict()["generate_shadow"] is True, "Stale group dict"
+    group.generate_shadow = False
+    print("  [PASS] Versioned group polling")
+
     # Set bundle
     mgr.set_active_bundle("comp_full")
     assert mgr.session.active_bundle == "comp_full", "Bundle not set"
@@ -422,6 +573,40 @@ def test_aurora_manager():
     group_aovs = [a for a in aovs if a.light_group == "key_lights"]
     print(f"  [PASS] Light group AOVs: {len(group_aovs)}")
 
+    # Default composition has one AOV per name
+    names = [a.name for a in aovs]
+    assert len(names) == len(set(names)), "Duplicate AOV names"
+    assert len(mgr.get_all_aovs(dedupe=False)) >= len(aovs), "Raw AOV list too short"
+    print("  [PASS] AOV names deduplicated")
+
+    # AOV cache invalidation
+    assert [a.name for a in mgr.get_all_aovs()] == [a.name for a in aovs], "Cached AOVs differ"
+    version = mgr.state_version
+    mgr.set_group_enabled("key_lights", False)
+    assert mgr.state_version > version, "Mutation did not bump state version"
+    assert not [a for a in mgr.get_all_aovs() if a.light_group == "key_lights"], "Stale AOV cache"
+    mgr.set_group_enabled("key_lights", True)
+    assert len(mgr.get_all_aovs()) == len(aovs), "AOV cache not rebuilt"
+    print("  [PASS] AOV cache invalidation")
+
+    # Unassigned lights track group membership
+    mgr.update_scene_cache(
+        ["/World/Lights/key_main", "/World/Lights/key_fill", "/World/Lights/rim_left"],
+        [],
+    )
+    assert mgr.get_unassigned_lights() == ["/World/Lights/rim_left"], "Unassigned lights wrong"
+    mgr.remove_light_from_group("key_lights", "/World/Lights/key_fill")
+    assert "/World/Lights/key_fill" in mgr.get_unassigned_lights(), "Removed light still assigned"
+    print(f"  [PASS] Unassigned lights: {mgr.get_unassigned_lights()}")
+
+    # Removed members are pooled and reused with fresh settings
+    mgr.add_light_to_group("key_lights", "/World/Lights/key_fill", LightType.RECT)
+    readded = mgr.get_light_group("key_lights").members[-1]
+    assert readded.prim_path == "/World/Lights/key_fill", "Pooled member not reset"
+    assert readded.enabled and readded.contribution == 1.0, "Pooled member kept old state"
+    assert readded.to_dict()["prim_path"] == "/World/Lights/key_fill", "Stale member cache"
+    print("  [PASS] Member pool reuse")
+
     # Test linker access
     linker = mgr.linker
     assert linker is not None, "No linker"
@@ -437,6 +622,100 @@ def test_aurora_manager():
     return True
 
 
+def test_aurora_incremental_save():
+    """Test incremental session checkpoints"""
+    print("\n=== Testing Aurora Incremental Save ===")
+
+    import tempfile
+    from pathlib import Path
+    from aurora.manager import AuroraManager, delta_path_for
+    from aurora.models import LightType, LightRole
+    from core.gates import GateLevel, HumanGate
+
+    HumanGate.reset_instance()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.json"
+
+        mgr = AuroraManager()
+        mgr.create_light_group(
+            "key_lights", LightRole.KEY,
+            lights=[("/World/Lights/key_main", LightType.RECT)],
+            gate_level=GateLevel.INFORM,
+        )
+
+        # First checkpoint has no base, so it writes a full snapshot
+        assert mgr.save_session_incremental(path) == 0, "Expected full save"
+        assert path.exists(), "Base snapshot not written"
+        print("  [PASS] Initial full snapshot")
+
+        mgr.create_light_group(
+            "rim_lights", LightRole.RIM,
+            lights=[("/World/Lights/rim_left", LightType.RECT)],
+            gate_level=GateLevel.INFORM,
+        )
+        mgr.get_all_aovs()
+        assert set(mgr._group_aov_cache) == {"key_lights", "rim_lights"}, "Group AOVs not memoized"
+        mgr.delete_light_group("key_lights")
+        assert set(mgr._group_aov_cache) == {"rim_lights"}, "Deleted group's AOVs still cached"
+        mgr.toggle_aov("beauty", False)
+
+        written = mgr.save_session_incremental(path)
+        assert written == 3, f"Expected 3 delta records, got {written}"
+        assert delta_path_for(path).exists(), "Delta sidecar not written"
+        print(f"  [PASS] Wrote {written} delta records")
+
+        restored = AuroraManager()
+        assert restored.load_session(path), "Load failed"
+        assert list(restored.session.light_groups) == ["rim_lights"], "Deltas not replayed"
+        assert restored.session.bundle_overrides == {"beauty": False}, "Overrides not replayed"
+        print("  [PASS] Deltas replayed on load")
+
+        # A different existing file gets a full save, not deltas against the wrong base
+        other_path = Path(tmp) / "other.json"
+        AuroraManager().save_session(other_path)
+        restored.toggle_aov("diffuse", False)
+        assert restored.save_session_incremental(other_path) == 0, "Deltas written against another base"
+        assert not delta_path_for(other_path).exists(), "Delta sidecar written for another base"
+        assert restored.save_session_incremental(path) == 0, "Switching back should save a full base"
+        del restored.session.bundle_overrides["diffuse"]
+        print("  [PASS] Incremental save to a new path writes a full base")
+
+        restored.compact(path)
+        assert not delta_path_for(path).exists(), "Compaction left sidecar behind"
+        print("  [PASS] Compaction")
+
+        # Stdlib json fallback, as used when orjson is not installed
+        import core.jsonio as jsonio_module
+        saved_orjson = jsonio_module.orjson
+        jsonio_module.orjson = None
+        try:
+            plain_path = Path(tmp) / "session_stdlib.json"
+            restored.save_session(plain_path)
+            reloaded = AuroraManager()
+            assert reloaded.load_session(plain_path), "Stdlib load failed"
+            assert list(reloaded.session.light_groups) == ["rim_lights"], "Stdlib round trip lost groups"
+            assert reloaded.session.bundle_overrides == {"beauty": False}, "Stdlib round trip lost overrides"
+        finally:
+            jsonio_module.orjson = saved_orjson
+        print("  [PASS] Save/load without orjson")
+
+        # Loading a session without groups skips the bundle rebuild
+        empty_path = Path(tmp) / "session_empty.json"
+        AuroraManager().save_session(empty_path)
+        fresh = AuroraManager()
+        default_bundle = fresh.get_bundle("comp_basic")
+        assert fresh.load_session(empty_path), "Empty load failed"
+        assert fresh.get_bundle("comp_basic") is default_bundle, "Group-less bundle rebuilt"
+        assert any(a.light_group for a in reloaded.get_bundle("comp_basic").aovs), "Group AOVs missing"
+        assert reloaded.load_session(empty_path), "Empty reload failed"
+        assert not any(a.light_group for a in reloaded.get_bundle("comp_basic").aovs), "Stale group AOVs"
+        print("  [PASS] Empty session keeps default bundles")
+
+    print("  All incremental save tests passed!")
+    return True
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 60)
@@ -451,6 +730,7 @@ def run_all_tests():
         ("LPE Generation", test_lpe_generation),
         ("Light Linking", test_light_linking),
         ("Aurora Manager", test_aurora_manager),
+        ("Aurora Incremental Save", test_aurora_incremental_save),
     ]
 
     results = []